@@ -0,0 +1,245 @@
+import os, sys, json, random, platform, argparse, statistics, tempfile
+from contextlib import redirect_stdout
+from time import perf_counter_ns
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+from pygame import Rect
+from pygame.math import Vector2
+from engine import *
+from game import GameConfig, GameLoop
+
+class BenchmarkConfig(GameConfig):
+	def __init__(self, replay_input=None):
+		self.replay_input = replay_input
+
+	def get_headless(self):
+		return True
+
+	def get_record_input(self):
+		return None
+
+	def get_replay_input(self):
+		return self.replay_input
+
+	def get_debug(self):
+		return dict(
+			map_debug = False,
+			player_debug = False,
+			start_zone = None,
+			start_position = None,
+			player_invincible = False,
+			profiler = False,
+		)
+
+class BenchmarkEntity(Entity):
+	def __init__(self, view, *position):
+		super().__init__(view=view, position=position, gravity=True)
+		self.rect = Rect(0, 0, TILE_WIDTH, TILE_HEIGHT)
+
+def summarize(samples):
+	samples = sorted(samples)
+	count = len(samples)
+
+	return dict(
+		count = count,
+		min_ms = samples[0] / 1e6,
+		mean_ms = statistics.mean(samples) / 1e6,
+		median_ms = statistics.median(samples) / 1e6,
+		p95_ms = samples[min(count - 1, int(count * 0.95))] / 1e6,
+		max_ms = samples[-1] / 1e6,
+	)
+
+def measure(fn, repeat, setup=None):
+	samples = []
+	for _ in range(repeat):
+		if setup is not None:
+			setup()
+
+		start = perf_counter_ns()
+		fn()
+		samples.append(perf_counter_ns() - start)
+
+	return summarize(samples)
+
+def new_game_loop(replay_input=None):
+	config = BenchmarkConfig(replay_input)
+	logger = Logger(ERROR)
+	loader = ResourceLoader(config, logger)
+
+	return GameLoop(config, logger, loader)
+
+def bench_startup(args):
+	game_loop = new_game_loop()
+	game_loop.services.init()
+	results = dict(load_map=measure(lambda: game_loop.loader.read_map(game_loop.config.get_map()), args.repeat))
+
+	def first_frame():
+		cold_game_loop = new_game_loop()
+		cold_game_loop.set_mode(MODE_GAME)
+		cold_game_loop.mode.update(1 / FPS)
+		cold_game_loop.mode.render()
+
+	results['first_frame'] = measure(first_frame, args.repeat)
+
+	return results
+
+def bench_stage(args):
+	game_loop = new_game_loop()
+	game_loop.set_mode(MODE_GAME)
+	game = game_loop.mode
+	stage, view, buffer = game.stage, game.view, game.buffer
+
+	results = dict()
+	for zone in stage.get_zones():
+		view.set_offset(Vector2(zone.get_position()))
+
+		def frame():
+			stage.update(1 / FPS)
+			stage.draw(buffer)
+
+		results[zone.get_name()] = measure(frame, args.repeat)
+
+	return results
+
+def bench_collision(args):
+	game_loop = new_game_loop()
+	game_loop.set_mode(MODE_GAME)
+	game = game_loop.mode
+	rng = random.Random(args.seed)
+	platforms = list(game.stage.get_platforms())
+
+	results = dict()
+	for count in args.entities:
+		entities = []
+		for _ in range(count):
+			platform = rng.choice(platforms)
+			x = rng.randint(platform.get_left(), platform.get_right())
+			entities.append(BenchmarkEntity(game.view, x, platform.get_top() - TILE_HALF_HEIGHT + 2))
+
+		def frame():
+			for entity in entities:
+				game.check_collision(entity)
+
+		results['entities_%d' % count] = measure(frame, args.repeat)
+
+	return results
+
+def bench_spawn(args):
+	game_loop = new_game_loop()
+	game_loop.set_mode(MODE_GAME)
+	game = game_loop.mode
+	stage, view, enemies, player = game.stage, game.view, game.enemies, game.player
+
+	definitions = list(enemies.get_definitions().items())
+	for copy in range(args.spawn_copies):
+		for name, definition in definitions:
+			x, y = definition['start_position']
+			enemies.load('%s-%d' % (name, copy), definition['type'], x, y, **definition['attributes'])
+
+	# despawn everything before each sample so every call does the real spawn work
+	def reset():
+		enemies.get_enemies().empty()
+		for definition in enemies.get_definitions().values():
+			definition['count'] = 0
+
+	results = dict(definitions=len(enemies.get_definitions()))
+	for zone in stage.get_zones():
+		stage.set_zone(zone.get_name())
+		view.set_offset(Vector2(zone.get_position()))
+		results[zone.get_name()] = measure(lambda: enemies.spawn_nearby(player, zone, False), args.repeat, reset)
+
+	results['frame_cache'] = game.spritesheet_loader.get_frame_cache().get_stats()
+
+	return results
+
+def generate_recording(filename, seed, ticks):
+	# run right the whole time, jumping and shooting on a fixed rhythm
+	events = [(0, pygame.KEYDOWN, pygame.K_RIGHT)]
+	for tick in range(FPS, ticks, FPS):
+		events.append((tick, pygame.KEYDOWN, pygame.K_SPACE))
+		events.append((tick + FPS // 3, pygame.KEYUP, pygame.K_SPACE))
+	for tick in range(FPS // 2, ticks, FPS // 2):
+		events.append((tick, pygame.KEYDOWN, pygame.K_f))
+		events.append((tick + 2, pygame.KEYUP, pygame.K_f))
+
+	events.sort(key=lambda event: event[0])
+	InputRecording(seed, events, ticks).save(filename)
+
+def bench_replay(args):
+	if args.replay is not None:
+		return run_replay(args.replay)
+
+	with tempfile.TemporaryDirectory() as directory:
+		filename = os.path.join(directory, 'benchmark-replay.json')
+		generate_recording(filename, args.seed, args.replay_ticks)
+		return run_replay(filename)
+
+def run_replay(filename):
+	game_loop = new_game_loop(filename)
+	game_loop.set_mode(MODE_GAME)
+
+	samples = []
+	while game_loop.running and game_loop.mode_id == MODE_GAME:
+		start = perf_counter_ns()
+		game_loop.step()
+		samples.append(perf_counter_ns() - start)
+
+	return dict(update=summarize(samples))
+
+SCENARIOS = dict(
+	startup = bench_startup,
+	stage = bench_stage,
+	collision = bench_collision,
+	spawn = bench_spawn,
+	replay = bench_replay,
+)
+
+def main():
+	parser = argparse.ArgumentParser(description='Run engine benchmarks and emit JSON results')
+	parser.add_argument('scenarios', nargs='*', help='any of: %s (default: all)' % ', '.join(SCENARIOS.keys()))
+	parser.add_argument('--repeat', type=int, default=100)
+	parser.add_argument('--entities', type=int, nargs='+', default=[10, 100, 1000])
+	parser.add_argument('--spawn-copies', type=int, default=10)
+	parser.add_argument('--replay', default=None, help='recording to replay (default: a generated one)')
+	parser.add_argument('--replay-ticks', type=int, default=FPS * 30)
+	parser.add_argument('--seed', type=int, default=0)
+	parser.add_argument('--output', default=None)
+	args = parser.parse_args()
+
+	scenarios = args.scenarios or list(SCENARIOS.keys())
+	for name in scenarios:
+		if name not in SCENARIOS:
+			parser.error('unknown scenario %s' % name)
+
+	pygame.init()
+
+	report = dict(
+		meta = dict(
+			python = platform.python_version(),
+			pygame = pygame.version.ver,
+			platform = platform.platform(),
+			repeat = args.repeat,
+		),
+		results = dict(),
+	)
+
+	# engine prints go to stderr so stdout carries only the JSON report
+	with redirect_stdout(sys.stderr):
+		for name in scenarios:
+			report['results'][name] = SCENARIOS[name](args)
+
+	pygame.quit()
+
+	output = json.dumps(report, indent=2)
+	if args.output is None:
+		print(output)
+	else:
+		with open(args.output, 'w') as f:
+			f.write(output)
+
+if __name__ == '__main__':
+	main()
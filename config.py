@@ -1,9 +1,17 @@
 MAP = 'cutman.tmx'
+MAP_CACHE = True
 SCALE2X = False
+# nearest, smooth, scale2x or sdl2
+PRESENT_MODE = 'nearest'
+FIXED_TIMESTEP = True
+HEADLESS = False
+RECORD_INPUT = None
+REPLAY_INPUT = None
 
 MAP_DEBUG = False
 PLAYER_DEBUG = False
 PLAYER_INVINCIBLE = False
+PROFILER = False
 DEBUG_START_ZONE = None
 DEBUG_START_POSITION = None
 # DEBUG_START_ZONE = 'z12'
@@ -2,17 +2,26 @@ from .constants import *
 from .util import *
 from .logger import *
 from .input import *
+from .replay import *
 from .loader import *
 from .animation import *
 from .sprite import *
 from .sound import *
+from .services import *
 from .object import *
+from .projectile import *
+from .spawn import *
+from .broadphase import *
+from .present import *
+from .text import *
 from .tile import *
+from .grid import *
 from .enemy import Enemies
 from .hazards import Hazards
 from .stage import *
 from .weapon import *
 from .hud import *
+from .profiler import *
 from .player import *
 from .menu import *
 from .game import *
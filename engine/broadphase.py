@@ -0,0 +1,32 @@
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+from .constants import *
+
+def pack_bounds(rects):
+	return numpy.array([(rect.left, rect.top, rect.right, rect.bottom) for rect in rects], dtype=numpy.int32).reshape(-1, 4)
+
+def overlapping_pairs_numpy(rects_a, rects_b):
+	a, b = pack_bounds(rects_a), pack_bounds(rects_b)
+	al, at, ar, ab = (a[:, i, None] for i in range(4))
+	bl, bt, br, bb = (b[None, :, i] for i in range(4))
+
+	# same test as Rect.colliderect, including empty rects never colliding
+	hits = (al < br) & (bl < ar) & (at < bb) & (bt < ab) & (al < ar) & (at < ab) & (bl < br) & (bt < bb)
+	rows, cols = numpy.nonzero(hits)
+
+	return list(zip(rows.tolist(), cols.tolist()))
+
+def overlapping_pairs_python(rects_a, rects_b):
+	return [(i, j) for i, a in enumerate(rects_a) for j, b in enumerate(rects_b) if a.colliderect(b)]
+
+def overlapping_pairs(rects_a, rects_b):
+	if len(rects_a) == 0 or len(rects_b) == 0:
+		return []
+
+	if numpy is not None and len(rects_a) * len(rects_b) >= BROADPHASE_MIN_PAIRS:
+		return overlapping_pairs_numpy(rects_a, rects_b)
+
+	return overlapping_pairs_python(rects_a, rects_b)
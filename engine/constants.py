@@ -25,7 +25,11 @@ MODE_GAME_OVER = 'game_over'
 TITLE_FONT_SIZE = 16
 PROMPT_FONT_SIZE = 12
 SCORE_FONT_SIZE = 8
+PROFILER_FONT_SIZE = 6
+PROFILER_WINDOW = 240
+PROFILER_REFRESH_FRAMES = 30
 FPS = 60
+MAX_TICKS_PER_FRAME = 5
 BASE_SCREEN_SIZE = 256
 SCALE_FACTOR = 3
 SCREEN_W = BASE_SCREEN_SIZE * SCALE_FACTOR
@@ -34,13 +38,30 @@ TILE_WIDTH = 16
 TILE_HALF_WIDTH = int(TILE_WIDTH / 2)
 TILE_HEIGHT = 16
 TILE_HALF_HEIGHT = int(TILE_HEIGHT / 2)
+TILE_CHUNK_WIDTH = TILE_WIDTH * 16
+TILE_CHUNK_HEIGHT = TILE_HEIGHT * 16
+GRID_CELL_WIDTH = TILE_WIDTH * 4
+GRID_CELL_HEIGHT = TILE_HEIGHT * 4
 
 PLAYER_WIDTH = 24
 PLAYER_HALF_WIDTH = int(PLAYER_WIDTH / 2)
 PLAYER_HEIGHT = 24
 PLAYER_HALF_HEIGHT = int(PLAYER_HEIGHT / 2)
 
+BUSTER_PELLET_CAPACITY = 8
+ENEMY_PELLET_CAPACITY = 64
+EXPLOSION_CAPACITY = 16
+
+BROADPHASE_MIN_PAIRS = 64
+
+VIEW_CULL_MARGIN = TILE_WIDTH * 2
+
+TEXT_CACHE_SIZE = 64
+
+SPRITE_SHEET_FLIPS = (None, 'x', 'y')
+
 TERMINAL_VELOCITY = 20
 GRAVITY = 9.8
 
-PLAYER_DEFEATED = pygame.USEREVENT + 1
\ No newline at end of file
+PLAYER_DEFEATED = pygame.USEREVENT + 1
+SOUND_FINISHED = pygame.USEREVENT + 2
\ No newline at end of file
@@ -6,20 +6,55 @@ from .entity import *
 from .constants import *
 from .animation import *
 from .explosion import *
+from .view import *
 from .util import *
+from .projectile import *
+from .spawn import *
+from .broadphase import *
 
 class Pellet(sprite.Sprite):
-	def __init__(self, image, view, damage, velocity, *position):
+	# image and rect stay in the Sprite base's __dict__, the pellet state is slotted
+	__slots__ = ('pool', 'position', 'previous_position', 'bounding_rect', 'bounding_key', 'velocity', 'damage', 'view')
+
+	def __init__(self, pool=None):
 		super().__init__()
+		self.pool = pool
+		self.image = None
+		self.rect = Rect(0, 0, 0, 0)
+		self.position = Vector2(0, 0)
+		self.previous_position = Vector2(0, 0)
+		self.bounding_rect = Rect(0, 0, 0, 0)
+		self.bounding_key = None
+		self.velocity = Vector2(0, 0)
+		self.damage = 0
+		self.view = None
+
+	def fire(self, image, view, damage, vx, vy, *position):
 		self.image = image
-		self.rect = image.get_rect()
-		self.position = Vector2(position[0], position[1])
+		self.rect.size = image.get_size()
+		self.position.update(position[0], position[1])
+		self.previous_position.update(position[0], position[1])
+		self.velocity.update(vx, vy)
 		self.damage = damage
 		self.view = view
-		self.velocity = velocity
+
+		offset = view.get_offset()
+		self.rect.center = int(position[0] - offset.x), int(position[1] - offset.y)
+
+	def kill(self):
+		alive = self.alive()
+		super().kill()
+
+		if alive and self.pool is not None:
+			self.pool.release(self)
 
 	def get_rect(self):
-		return Rect((self.get_left(), self.get_top()), (self.get_width(), self.get_height()))
+		key = self.position.x, self.position.y, self.rect.width, self.rect.height
+		if key != self.bounding_key:
+			self.bounding_key = key
+			self.bounding_rect.update(self.get_left(), self.get_top(), self.rect.width, self.rect.height)
+
+		return self.bounding_rect
 
 	def get_width(self):
 		return self.rect.width
@@ -48,7 +83,11 @@ class Pellet(sprite.Sprite):
 	def get_damage(self):
 		return self.damage
 
+	def hold(self):
+		self.previous_position.update(self.position)
+
 	def update_position(self):
+		self.previous_position.update(self.position)
 		v = self.velocity
 		self.position.x += v.x
 		self.position.y += v.y
@@ -59,6 +98,11 @@ class Pellet(sprite.Sprite):
 		offset = self.view.get_offset()
 		self.rect.center = int(self.position.x - offset.x), int(self.position.y - offset.y)
 
+	def interpolate(self, alpha):
+		p = self.previous_position.lerp(self.position, alpha)
+		offset = self.view.get_render_offset()
+		self.rect.center = int(p.x - offset.x), int(p.y - offset.y)
+
 class Enemy(Entity):
 	def __init__(self, name, spritesheet, view, sounds, enemies, player, stage, *position, **attributes):
 		self.name = name
@@ -406,9 +450,8 @@ class ScrewDriver(Enemy):
 
 		p = self.position
 		for angle in angles:
-			v = calculate_velocity(self.pellet_speed, angle)
-			pellet = Pellet(self.pellet_image, self.view, self.damage, v, p.x, p.y)
-			self.enemies.shoot(pellet)
+			vx, vy = calculate_velocity_components(self.pellet_speed, angle)
+			self.enemies.fire(self.pellet_image, self.damage, vx, vy, p.x, p.y)
 
 		self.shots += 1
 		if self.shots == 2:
@@ -544,10 +587,9 @@ class Blaster(Enemy):
 		return Vector2(vx, vy)
 
 	def shoot(self):
-		v = calculate_velocity(self.pellet_speed, self.angles.pop())
+		vx, vy = calculate_velocity_components(self.pellet_speed, self.angles.pop())
 		p = self.position
-		pellet = Pellet(self.pellet_image, self.view, self.damage, v, p.x, p.y)
-		self.enemies.shoot(pellet)
+		self.enemies.fire(self.pellet_image, self.damage, vx, vy, p.x, p.y)
 		self.sounds.play_sound('eshoot')
 		self.shoot_time = 0
 		self.shots_fired += 1
@@ -1087,9 +1129,8 @@ class Mambu(Enemy):
 		angles = [45, 90, 135, 180, 225, 270, 315, 360]
 		p = self.position
 		for angle in angles:
-			v = calculate_velocity(self.pellet_speed, angle)
-			pellet = Pellet(self.pellet_image, self.view, self.damage, v, p.x, p.y)
-			self.enemies.shoot(pellet)
+			vx, vy = calculate_velocity_components(self.pellet_speed, angle)
+			self.enemies.fire(self.pellet_image, self.damage, vx, vy, p.x, p.y)
 
 		self.sounds.play_sound('eshoot')
 
@@ -1135,7 +1176,7 @@ class BigEye(Enemy):
 		super().collide_bottom(y)
 
 	def get_jump_speed(self):
-		num = random.randint(1, 3)
+		num = self.enemies.get_random().randint(1, 3)
 		return self.high_jump_speed if num == 3 else self.normal_jump_speed
 
 	def jump(self):
@@ -1206,30 +1247,49 @@ ENEMY_CLASS=dict(
 )
 
 class Enemies:
-	def __init__(self, spritesheet_loader, sounds, view, stage, explosions, items):
+	def __init__(self, spritesheet_loader, sounds, view, stage, explosions, items, seed=None):
 		self.spritesheet = spritesheet_loader.load(self.get_spritesheet_filename())
 		self.view = view
 		self.sounds = sounds
 		self.spawn_range = 50
 		self.enemies = dict()
+		self.spawn_index = SpawnIndex()
 		self.explosions = explosions
 		self.items = items
 		self.stage = stage
-		self.enemy_sprite_group = sprite.Group()
-		self.pew_sprite_group = sprite.Group()
+		self.enemy_sprite_group = ViewGroup(view)
+		self.pew_sprite_group = ViewGroup(view)
+		self.pellet_pool = ProjectilePool(Pellet, ENEMY_PELLET_CAPACITY)
+		self.random = random.Random(seed)
 
 	def get_spritesheet_filename(self):
 		return 'enemies.png'
 
+	def get_random(self):
+		return self.random
+
 	def load(self, name, type, *start_position, **attributes):
 		self.enemies[name] = dict(start_position=start_position, type=type, count=0, attributes=attributes)
 
+		if 'zone' in attributes:
+			self.spawn_index.add(attributes['zone'], name, start_position[0])
+
+	def build_spawn_index(self):
+		self.spawn_index.build()
+
+	def get_spawn_index(self):
+		return self.spawn_index
+
+	def get_definitions(self):
+		return self.enemies
+
 	def spawn_nearby(self, player, zone, zoned):
 		view = self.view
 		vw, vh = view.get_width(), view.get_height()
 		offset = view.get_offset()
 
-		zenemies = list(filter((lambda name: 'zone' in self.enemies[name]['attributes'] and self.enemies[name]['attributes']['zone'] == zone.get_name()), self.enemies.keys()))
+		# spawn points 16px wide can only be in view or in range within this band
+		zenemies = self.spawn_index.query(zone.get_name(), offset.x - self.spawn_range - 16, offset.x + vw + self.spawn_range)
 
 		enemies = list()
 		for name in zenemies:
@@ -1270,6 +1330,16 @@ class Enemies:
 	def shoot(self, pew):
 		self.pew_sprite_group.add(pew)
 
+	def fire(self, image, damage, vx, vy, *position):
+		pellet = self.pellet_pool.acquire()
+		if pellet is None:
+			return None
+
+		pellet.fire(image, self.view, damage, vx, vy, position[0], position[1])
+		self.shoot(pellet)
+
+		return pellet
+
 	def explode(self, enemy):
 		x, y = enemy.get_rect().center
 		self.explosions.explode(self.view, Vector2(x, y))
@@ -1285,14 +1355,16 @@ class Enemies:
 				pew.kill()
 
 	def check_hits(self, player):
-		for pew in self.pew_sprite_group:
-			hit = pew.collides_with(player.get_rect())
-			if hit:
-				player.damage(pew.get_damage())
-				pew.kill()
+		pews = self.pew_sprite_group.sprites()
+		hits = overlapping_pairs([pew.get_rect() for pew in pews], [player.get_rect()])
+
+		for i, _ in hits:
+			pew = pews[i]
+			player.damage(pew.get_damage())
+			pew.kill()
 
 	def generate_loot(self, enemy):
-		num = random.randint(1, 100)
+		num = self.random.randint(1, 100)
 		loot_type = enemy.get_random_loot_type(num)
 		if loot_type == None:
 			return
@@ -1322,6 +1394,17 @@ class Enemies:
 		self.explosions.update(delta)
 		self.check_off_screen()
 
+	def hold(self):
+		for pew in self.pew_sprite_group:
+			pew.hold()
+
+		for enemy in self.enemy_sprite_group:
+			enemy.hold()
+
+	def interpolate(self, alpha):
+		self.pew_sprite_group.interpolate(alpha)
+		self.enemy_sprite_group.interpolate(alpha)
+
 	def draw(self, surface):
 		self.pew_sprite_group.draw(surface)
 		self.enemy_sprite_group.draw(surface)
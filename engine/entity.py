@@ -12,6 +12,9 @@ class Entity(sprite.Sprite):
 		self.spritesheet = spritesheet
 		self.position = Vector2(0, 0) if position is None else Vector2(position[0], position[1])
 		self.velocity = Vector2(0, 0) if velocity is None else Vector2(velocity[0], velocity[1])
+		self.previous_position = None
+		self.bounding_rect = Rect(0, 0, 0, 0)
+		self.bounding_key = None
 		self.view = view
 
 		self.gravity = gravity
@@ -95,7 +98,13 @@ class Entity(sprite.Sprite):
 		return int(self.position.x + int(self.get_width() / 2))
 
 	def get_rect(self):
-		return Rect((self.get_left(), self.get_top()), (self.get_width(), self.get_height()))
+		width, height = self.get_width(), self.get_height()
+		key = self.position.x, self.position.y, width, height
+		if key != self.bounding_key:
+			self.bounding_key = key
+			self.bounding_rect.update(self.get_left(), self.get_top(), width, height)
+
+		return self.bounding_rect
 
 	def get_width(self):
 		return self.rect.width
@@ -195,7 +204,23 @@ class Entity(sprite.Sprite):
 		offset = self.view.get_offset()
 		self.rect.center = int(p.x - offset.x), int(p.y - offset.y)
 
+	def interpolate(self, alpha):
+		if self.rect is None:
+			return
+
+		p = self.position if self.previous_position is None else self.previous_position.lerp(self.position, alpha)
+		offset = self.view.get_render_offset()
+		self.rect.center = int(p.x - offset.x), int(p.y - offset.y)
+
+	def hold(self):
+		if self.previous_position is not None:
+			self.previous_position.update(self.position)
+
 	def update(self, delta):
+		if self.previous_position is None:
+			self.previous_position = Vector2(self.position)
+		else:
+			self.previous_position.update(self.position)
 		self.update_state(delta)
 		self.update_position(delta)
 		self.update_sprite(delta)
\ No newline at end of file
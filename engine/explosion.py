@@ -1,68 +1,121 @@
 from pygame import sprite
 from pygame.sprite import Rect
 from pygame.math import Vector2
-import copy
-from .animation import *
+from .constants import *
+from .view import *
 
 class Explosions:
-	def __init__(self, spritesheet_loader):
+	FRAMES = [
+		((48, 10), (16, 16)),
+		((67, 13), (12, 12)),
+		((82, 13), (10, 10)),
+		((84, 16), (4, 4))
+	]
+	FRAME_DURATION = 0.1
+	BIG_EXPLOSION_VELOCITIES = [(0, -2), (1, -1), (2, 0), (1, 1), (0, 2), (-1, 1), (-2, -0), (-1, -1)]
+
+	def __init__(self, spritesheet_loader, view):
 		self.spritesheet_loader = spritesheet_loader
-		self.explosion_sprite_group = sprite.Group()
+		self.view = view
+		self.explosion_sprite_group = ViewGroup(view)
 		self.spritesheet = self.spritesheet_loader.load(self.get_spritesheet_filename())
+		self.frames = self.load_frames()
+		self.free = [Explosion(self) for _ in range(EXPLOSION_CAPACITY)]
 
 	def get_spritesheet_filename(self):
 		return 'weapon-sprites-2.png'
 
+	def load_frames(self):
+		image_at = self.spritesheet.image_at
+		return [image_at(Rect(at, size), -1) for at, size in self.FRAMES]
+
+	def get_frames(self):
+		return self.frames
+
+	def get_free_count(self):
+		return len(self.free)
+
+	def acquire(self):
+		return self.free.pop() if len(self.free) > 0 else Explosion(self)
+
+	def release(self, explosion):
+		self.free.append(explosion)
+
 	def explode(self, view, position):
-		explosion = Explosion(self.spritesheet, view, position)
+		explosion = self.acquire()
+		explosion.start(view, position)
 		self.explosion_sprite_group.add(explosion)
 
 	def big_explode(self, view, position):
-		vs = [Vector2(0, -2), Vector2(1, -1), Vector2(2, 0), Vector2(1, 1), Vector2(0, 2), Vector2(-1, 1), Vector2(-2, -0), Vector2(-1, -1)]
-		for v in vs:
-			self.explosion_sprite_group.add(Explosion(self.spritesheet, view, position, loop=True, velocity=v))
+		for vx, vy in self.BIG_EXPLOSION_VELOCITIES:
+			explosion = self.acquire()
+			explosion.start(view, position, loop=True, velocity=(vx, vy))
+			self.explosion_sprite_group.add(explosion)
 
 	def update(self, delta):
 		self.explosion_sprite_group.update(delta)
 
+	def interpolate(self, alpha):
+		self.explosion_sprite_group.interpolate(alpha)
+
 	def draw(self, surface):
 		self.explosion_sprite_group.draw(surface)
 
 class Explosion(sprite.Sprite):
-	def __init__(self, spritesheet, view, position, loop=False, velocity=None):
+	def __init__(self, explosions):
 		super().__init__()
-		self.spritesheet = spritesheet
-		self.position = copy.deepcopy(position)
+		self.explosions = explosions
+		self.frames = explosions.get_frames()
+		self.position = Vector2(0, 0)
+		self.previous_position = Vector2(0, 0)
+		self.velocity = Vector2(0, 0)
+		self.bounding_rect = Rect(0, 0, 0, 0)
+		self.moving = False
+		self.view = None
+		self.loop = False
+		self.index = 0
+		self.current_time = 0
+		self.image = self.frames[0]
+		self.rect = self.image.get_rect()
+
+	def start(self, view, position, loop=False, velocity=None):
 		self.view = view
-		self.animation = None
-		self.velocity = velocity
+		self.position.update(position)
+		self.previous_position.update(position)
+		self.moving = velocity is not None
+		self.velocity.update(velocity if velocity is not None else (0, 0))
 		self.loop = loop
+		self.index = 0
 		self.current_time = 0
+		self.image = self.frames[0]
+		self.rect.size = self.image.get_size()
 
-		# print('v=%d,%d'%(velocity.x, velocity.y))
+	def kill(self):
+		alive = self.alive()
+		super().kill()
 
-		self.load_sprites()
+		if alive:
+			self.explosions.release(self)
 
-	def load_sprites(self):
-		image_at = self.spritesheet.image_at
+	def next_frame(self):
+		last = len(self.frames) - 1
+		self.index = 0 if self.index == last else self.index + 1
 
-		self.animation = Animation([
-			dict(duration=0.1, image=image_at(Rect((48, 10), (16, 16)), -1)),
-			dict(duration=0.1, image=image_at(Rect((67, 13), (12, 12)), -1)),
-			dict(duration=0.1, image=image_at(Rect((82, 13), (10, 10)), -1)),
-			dict(duration=0.1, image=image_at(Rect((84, 16), (4, 4)), -1), callback=self.remove)
-		])
+		if self.index == last and not self.loop:
+			self.kill()
 
-		start_frame = self.animation.current()
-		self.image = start_frame['image']
-		self.rect = self.image.get_rect()
+		return self.frames[self.index]
 
-	def remove(self):
-		if not self.loop:
-			self.kill()
+	def get_rect(self):
+		p = self.position
+		self.bounding_rect.size = self.rect.size
+		self.bounding_rect.center = int(p.x), int(p.y)
+
+		return self.bounding_rect
 
 	def update_position(self):
-		if self.velocity is not None:
+		if self.moving:
+			self.previous_position.update(self.position)
 			p, v = self.position, self.velocity
 			p.x += v.x
 			p.y += v.y
@@ -70,15 +123,19 @@ class Explosion(sprite.Sprite):
 	def update(self, delta):
 		self.update_position()
 
-		animation = self.animation
 		self.current_time += delta
-		if self.current_time >= animation.next_time:
+		if self.current_time >= Explosions.FRAME_DURATION:
 			prev_center = self.rect.center
-			self.image = animation.next(0)['image']
-			self.rect.width = self.image.get_rect().width
+			self.image = self.next_frame()
+			self.rect.width = self.image.get_width()
 			self.rect.center = prev_center
 			self.current_time = 0
 
 		p = self.position
 		offset = self.view.get_offset()
-		self.rect.center = p.x - offset.x, p.y - offset.y
\ No newline at end of file
+		self.rect.center = p.x - offset.x, p.y - offset.y
+
+	def interpolate(self, alpha):
+		p = self.previous_position.lerp(self.position, alpha)
+		offset = self.view.get_render_offset()
+		self.rect.center = p.x - offset.x, p.y - offset.y
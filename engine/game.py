@@ -1,5 +1,5 @@
 import pygame
-from pygame import sprite, transform, display, draw
+from pygame import sprite, draw
 from pygame.math import Vector2
 from .constants import *
 from .sprite import *
@@ -7,19 +7,23 @@ from .player import *
 from .stage import *
 from .hud import *
 from .view import *
+from .profiler import *
+from .present import *
 
 class Game:
-	def __init__(self, config, logger, input, loader, screen, sounds, music_player, game):
+	def __init__(self, config, logger, input, loader, screen, sounds, music_player, game, seed=None, spritesheet_loader=None, presenter=None):
 		self.logger = logger
 		self.config = config
 		self.screen = screen
+		self.presenter = NearestPresenter(screen) if presenter is None else presenter
 		self.input = input
 		self.buffer = pygame.Surface((int(SCREEN_W / SCALE_FACTOR), int(SCREEN_H / SCALE_FACTOR)))
 		self.loader = loader
 		self.sounds = sounds
 		self.music_player = music_player
 		self.game = game
-		self.spritesheet_loader = SpriteSheetLoader(self.loader)
+		self.seed = seed
+		self.spritesheet_loader = SpriteSheetLoader(self.loader) if spritesheet_loader is None else spritesheet_loader
 		self.sprites = sprite.Group()
 		self.view = View(int(SCREEN_W / SCALE_FACTOR), int(SCREEN_H / SCALE_FACTOR))
 
@@ -41,16 +45,21 @@ class Game:
 		self.enemies = None
 		self.warp_start_position = None
 		self.warp_land_position = None
-		self.explosions = Explosions(self.spritesheet_loader)
+		self.explosions = Explosions(self.spritesheet_loader, self.view)
 
 		self.debug = self.config.get_debug()
 
+		self.profiler = FrameProfiler()
+		self.profiler_overlay = ProfilerOverlay(self.profiler, self.loader.load_font('megaman_2.ttf', PROFILER_FONT_SIZE))
+		if self.debug['profiler']:
+			self.profiler_overlay.toggle()
+
 		self.init_stage()
 		self.init_player()
 		self.init_hud()
 
 	def init_stage(self):
-		self.stage = Stage(self.config, self.loader, self.spritesheet_loader, self.view, self.sounds, self.explosions)
+		self.stage = Stage(self.config, self.loader, self.spritesheet_loader, self.view, self.sounds, self.explosions, self.seed)
 
 		self.platforms = self.stage.get_platforms()
 		self.ladders = self.stage.get_ladders()
@@ -81,8 +90,9 @@ class Game:
 
 	def check_collision(self, entity, recursion=False):
 		collided = False
-		colliding_platforms = list(filter((lambda platform: platform.collides_with(entity.get_rect())), self.platforms))
-		colliding_ladders = list(filter((lambda ladder: ladder.collides_with(entity.get_rect())), self.ladders))
+		rect = entity.get_rect()
+		colliding_platforms = self.stage.colliding_platforms(rect)
+		colliding_ladders = self.stage.colliding_ladders(rect)
 
 		v = entity.get_velocity()
 		p = entity.get_position()
@@ -136,7 +146,7 @@ class Game:
 				player.arrive(lp.y)
 			return
 
-		colliding_hazards = list(filter((lambda hazard: hazard.collides_with(player.get_rect())), self.hazards))
+		colliding_hazards = stage.colliding_hazards(player.get_rect())
 		if len(colliding_hazards) > 0:
 			p = player.get_position()
 			hazard = colliding_hazards[0]
@@ -271,14 +281,7 @@ class Game:
 			self.transitioning = True
 			self.transition_from_zone = from_zone
 			self.transition_to_zone = to_zone
-
-			from_p = from_zone.get_position()
-			to_p = to_zone.get_position()
-
-			if to_p.y != from_p.y:
-				self.transition_axis = 'y'
-			else:
-				self.transition_axis = 'x'
+			self.transition_axis = self.stage.get_transition_axis(from_zone, to_zone)
 
 	def stop_transition_zones(self):
 		self.stage.set_zone(self.transition_to_zone.get_name())
@@ -288,6 +291,8 @@ class Game:
 		self.transition_axis = None
 		self.zoned = True
 
+		self.logger.debug('zone %s: %r' % (self.stage.get_zone().get_name(), self.spritesheet_loader.get_frame_cache()))
+
 	def update_zone(self):
 		player = self.player
 		zone = self.stage.get_zone()
@@ -408,38 +413,68 @@ class Game:
 		hud = self.hud
 		stage = self.stage
 		explosions = self.explosions
+		run = self.profiler.run
+
+		view.step()
+
+		# play stops while the energy refill sound runs, as it did when that sound blocked
+		if player.is_refilling():
+			for entity in sprites:
+				entity.hold()
+			self.enemies.hold()
+			self.items.hold()
+			return
 
 		if player.is_dead():
 			if not self.player_dead:
 				self.player_dead = True
 				self.explosions.big_explode(view, player.get_position())
 				self.music_player.stop()
-				self.sounds.play_sound('defeat', False, PLAYER_DEFEATED)
+				self.sounds.play_sound('defeat', PLAYER_DEFEATED)
+
+			# nothing else moves this tick, so stop interpolating from the last live one
+			self.enemies.hold()
+			self.items.hold()
 		else:
-			self.update_player(delta)
-			self.update_enemies(delta)
-			self.update_items(delta)
-			self.update_gates(delta)
-			self.check_weapon_hits()
+			run('player', self.update_player, delta)
+			run('enemies', self.update_enemies, delta)
+			run('items', self.update_items, delta)
+			run('gates', self.update_gates, delta)
+			run('hits', self.check_weapon_hits)
 
-			self.update_zone()
-			self.update_scrolling()
+			run('zone', self.update_zone)
+			run('scroll', self.update_scrolling)
 
 			view.update()
 
-		sprites.update(delta)
-		stage.update(delta)
-		hud.update(delta)
-		explosions.update(delta)
+		run('sprites', sprites.update, delta)
+		run('stage', stage.update, delta)
+		run('hud', hud.update, delta)
+		run('explode', explosions.update, delta)
 
-	def render(self):
+	def interpolate(self, alpha):
+		self.view.set_alpha(alpha)
+		if alpha >= 1:
+			return
+
+		for entity in self.sprites:
+			entity.interpolate(alpha)
+
+		self.enemies.interpolate(alpha)
+		self.items.interpolate(alpha)
+		self.gates.interpolate(alpha)
+		self.explosions.interpolate(alpha)
+
+	def render(self, alpha=1):
 		buffer = self.buffer
 		sprites = self.sprites
-		screen = self.screen
 		stage = self.stage
 		zone = stage.get_zone()
 		hud = self.hud
 		view = self.view
+		run = self.profiler.run
+
+		self.interpolate(alpha)
 
 		background_color = zone.get_background_color()
 		if background_color is None:
@@ -447,10 +482,10 @@ class Game:
 
 		buffer.fill(background_color)
 
-		stage.draw(buffer)
-		self.enemies.draw(buffer)
-		self.items.draw(buffer)
-		self.gates.draw(buffer)
+		run('draw stage', stage.draw, buffer)
+		run('draw enemies', self.enemies.draw, buffer)
+		run('draw items', self.items.draw, buffer)
+		run('draw gates', self.gates.draw, buffer)
 
 		if self.debug['player_debug']:
 			player = self.player
@@ -459,19 +494,18 @@ class Game:
 			pvrect = Rect((prect.left - offset.x, prect.top - offset.y), (player.get_width(), player.get_height()))
 			draw.rect(buffer, (0, 255, 0), pvrect)
 		else:
-			sprites.draw(buffer)
+			run('draw sprites', sprites.draw, buffer)
 
-		self.score.draw(buffer)
-		hud.draw(buffer)
+		run('draw score', self.score.draw, buffer)
+		run('draw hud', hud.draw, buffer)
 
-		self.explosions.draw(buffer)
+		run('draw explode', self.explosions.draw, buffer)
 
-		if SCALE_FACTOR > 1:
-			screen.blit(transform.smoothscale(buffer, (SCREEN_W, SCREEN_W)), (0, 0))
-		else:
-			screen.blit(buffer, (0, 0))
+		self.profiler_overlay.draw(buffer)
+
+		run('present', self.presenter.present, buffer)
 
-		display.flip()
+		self.profiler.end_frame()
 
 	# Player Events
 
@@ -537,11 +571,15 @@ class Game:
 			return
 
 		pew = self.player.shoot()
-		self.sprites.add(pew)
+		if pew is not None:
+			self.sprites.add(pew)
 
 	def player_stop_shoot(self):
 		self.player.stop_shooting()
 
+	def toggle_profiler(self):
+		self.profiler_overlay.toggle()
+
 	def game_pause_unpause(self):
 		if not self.game.is_paused():
 			self.music_player.pause()
@@ -566,8 +604,12 @@ class Game:
 			if self.player.is_dead():
 				return
 
+			# Profiler
+			if input.is_profiler(event) and input.is_released(event):
+				self.toggle_profiler()
+
 			# Pause
-			if input.is_pause(event) and input.is_released(event):
+			elif input.is_pause(event) and input.is_released(event):
 				self.game_pause_unpause()
 
 			# Quit
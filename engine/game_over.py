@@ -1,12 +1,14 @@
 import pygame
-from pygame import display, Surface
+from pygame import Surface
 from pygame.sprite import Rect
 from .constants import *
+from .present import *
 
 class GameOver:
-	def __init__(self, logger, input, loader, screen, sounds, music_player, game, **opts):
+	def __init__(self, logger, input, loader, screen, sounds, music_player, game, presenter=None, **opts):
 		self.logger = logger
 		self.screen = screen
+		self.presenter = NearestPresenter(screen) if presenter is None else presenter
 		self.input = input
 		self.buffer = Surface((int(SCREEN_W), int(SCREEN_H)))
 		self.loader = loader
@@ -14,7 +16,9 @@ class GameOver:
 		self.sounds = sounds
 		self.music_player = music_player
 		self.game_over_font = self.loader.load_font('megaman_2.ttf', TITLE_FONT_SIZE)
+		self.text_cache = self.loader.get_text_cache()
 		self.game_over_time = 0
+		self.invalidated = True
 
 		self.area = Rect(0, 0, int(SCREEN_W / 2), int(SCREEN_H / 2))
 
@@ -24,24 +28,29 @@ class GameOver:
 		if self.game_over_time >= 5:
 			self.game.set_mode(MODE_MENU)
 
-	def render(self):
+	def invalidate(self):
+		self.invalidated = True
+
+	def render(self, alpha=1):
+		# nothing on this screen changes after the first frame
+		if not self.invalidated:
+			return
+
 		buffer = self.buffer
-		screen = self.screen
 		game_over_font = self.game_over_font
 
 		background_color = 0, 0, 0
 		default_font_color = 255, 255, 255
 		buffer.fill(background_color)
 
-		game_over_text = game_over_font.render('Game Over', 0, default_font_color)
+		game_over_text = self.text_cache.render(game_over_font, 'Game Over', default_font_color)
 		game_over_rect = game_over_text.get_rect(center=(SCREEN_W/2, SCREEN_H/2))
 
 		buffer.blit(game_over_text, game_over_rect)
 
-		screen.blit(buffer, buffer.get_rect())
-		# screen.blit(game_over_text, game_over_rect)
-
-		display.flip()
+		self.presenter.present(buffer)
+		self.invalidated = False
 
 	def handle_event(self, event):
-		pass
\ No newline at end of file
+		if event.type == pygame.VIDEOEXPOSE:
+			self.invalidate()
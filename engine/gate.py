@@ -1,8 +1,8 @@
-from pygame import sprite
 from pygame.sprite import Rect
 from pygame.math import Vector2
 from .object import *
 from .entity import *
+from .view import *
 
 class GateSprite(Entity):
 	def __init__(self, image, view, gate, *position):
@@ -11,6 +11,12 @@ class GateSprite(Entity):
 		self.rect = image.get_rect()
 		self.gate = gate
 
+	def get_rect(self):
+		p = self.position
+		self.bounding_rect.update(int(p.x), int(p.y), self.rect.width, self.rect.height)
+
+		return self.bounding_rect
+
 	def update(self, delta):
 		p = self.position
 
@@ -21,6 +27,11 @@ class GateSprite(Entity):
 		offset = view.get_offset()
 		self.rect.topleft = int(p.x - offset.x), int(p.y - offset.y)
 
+	def interpolate(self, alpha):
+		p = self.position
+		offset = self.view.get_render_offset()
+		self.rect.topleft = int(p.x - offset.x), int(p.y - offset.y)
+
 class Gate(GameObject):
 	def __init__(self, spritesheet, view, x, y, width, height):
 		self.spritesheet = spritesheet
@@ -36,7 +47,7 @@ class Gate(GameObject):
 		self.rect = Rect((x, y), (width, height))
 		self.max_height = self.rect.height
 
-		self.gate_sprite_group = sprite.Group()
+		self.gate_sprite_group = ViewGroup(view)
 
 		self.load_sprites()
 
@@ -99,8 +110,12 @@ class Gate(GameObject):
 					self.fill_sprites()
 					self.animation_time = 0
 
+		# every sprite updates so ones off view are still removed while opening
 		self.gate_sprite_group.update(delta)
 
+	def interpolate(self, alpha):
+		self.gate_sprite_group.interpolate(alpha)
+
 	def draw(self, surface):
 		self.gate_sprite_group.draw(surface)
 
@@ -125,6 +140,10 @@ class Gates:
 		for gate in self.gates.values():
 			gate.update(delta)
 
+	def interpolate(self, alpha):
+		for gate in self.gates.values():
+			gate.interpolate(alpha)
+
 	def draw(self, surface):
 		for gate in self.gates.values():
 			gate.draw(surface)
\ No newline at end of file
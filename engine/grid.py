@@ -0,0 +1,56 @@
+from .constants import *
+
+class SpatialGrid:
+	def __init__(self, cell_width=GRID_CELL_WIDTH, cell_height=GRID_CELL_HEIGHT):
+		self.cell_width = cell_width
+		self.cell_height = cell_height
+		self.cells = dict()
+		self.count = 0
+
+	def get_cell_span(self, left, top, right, bottom):
+		cw, ch = self.cell_width, self.cell_height
+		return range(left // cw, ((right - 1) // cw) + 1), range(top // ch, ((bottom - 1) // ch) + 1)
+
+	def get_cell_range(self, rect):
+		return self.get_cell_span(rect.left, rect.top, rect.right, rect.bottom)
+
+	def insert(self, obj, rect=None):
+		rect = obj.get_rect() if rect is None else rect
+		self.insert_bounds(obj, rect.left, rect.top, rect.right, rect.bottom)
+
+	def insert_layer(self, layer):
+		bounds = layer.get_bounds()
+		for i, obj in enumerate(layer.get_objects()):
+			self.insert_bounds(obj, bounds[i * 4], bounds[i * 4 + 1], bounds[i * 4 + 2], bounds[i * 4 + 3])
+
+	def insert_bounds(self, obj, left, top, right, bottom):
+		index = self.count
+		self.count += 1
+
+		xs, ys = self.get_cell_span(left, top, right, bottom)
+		for cy in ys:
+			for cx in xs:
+				if (cx, cy) in self.cells:
+					self.cells[cx, cy].append((index, obj))
+				else:
+					self.cells[cx, cy] = [(index, obj)]
+
+	def query(self, rect):
+		cells = self.cells
+		xs, ys = self.get_cell_range(rect)
+
+		if len(xs) == 1 and len(ys) == 1:
+			key = xs[0], ys[0]
+			return [obj for _, obj in cells[key]] if key in cells else []
+
+		found = dict()
+		for cy in ys:
+			for cx in xs:
+				if (cx, cy) in cells:
+					for index, obj in cells[cx, cy]:
+						found[index] = obj
+
+		return [found[index] for index in sorted(found)]
+
+	def colliding(self, rect):
+		return [obj for obj in self.query(rect) if rect.colliderect(obj.rect)]
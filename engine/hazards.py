@@ -8,7 +8,7 @@ class Hazards:
 		else:
 			raise SystemExit('Invalid hazard type %d'%type)
 
-class Hazard(GameObject):
+class Hazard(StaticObject):
 	def __init__(self, rect, damage):
 		super().__init__(rect)
 		self.damage = damage
@@ -17,25 +17,37 @@ class HudGroup(sprite.Group):
 class Score:
 	def __init__(self, loader, player):
 		self.font = loader.load_font('megaman_2.ttf', SCORE_FONT_SIZE)
+		self.text_cache = loader.get_text_cache()
 		self.player = player
 		self.text_color = 255, 255, 255
 		self.shadow_color = 0, 0, 0
 		self.dshadow_offset = 1 + (SCORE_FONT_SIZE // 15)
+		self.score = None
+		self.score_text = None
+		self.score_rect = None
+		self.score_shadow_text = None
+		self.score_shadow_rect = None
 
 	def update(self, delta):
 		pass
 
-	def draw(self, surface):
-		score = "%07d" % self.player.get_score()
+	def render(self, score):
+		text = "%07d" % score
 		position = round(BASE_SCREEN_SIZE/2), 10
 		dshadow_position = round(BASE_SCREEN_SIZE/2) + self.dshadow_offset, 10 + self.dshadow_offset
-		score_text = self.font.render(score, False, self.text_color)
-		score_shadow_text = self.font.render(score, False, self.shadow_color)
-		score_shadow_rect = score_shadow_text.get_rect(center=dshadow_position)
-		score_rect = score_text.get_rect(center=position)
+		self.score_text = self.text_cache.render(self.font, text, self.text_color)
+		self.score_shadow_text = self.text_cache.render(self.font, text, self.shadow_color)
+		self.score_shadow_rect = self.score_shadow_text.get_rect(center=dshadow_position)
+		self.score_rect = self.score_text.get_rect(center=position)
+		self.score = score
+
+	def draw(self, surface):
+		score = self.player.get_score()
+		if score != self.score:
+			self.render(score)
 
-		surface.blit(score_shadow_text, score_shadow_rect)
-		surface.blit(score_text, score_rect)
+		surface.blit(self.score_shadow_text, self.score_shadow_rect)
+		surface.blit(self.score_text, self.score_rect)
 
 class LifeMeter(sprite.Sprite):
 	def __init__(self, spritesheet_loader, sounds, player):
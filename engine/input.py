@@ -28,6 +28,9 @@ class InputMethod:
 	def is_pause(self, event):
 		return False
 
+	def is_profiler(self, event):
+		return False
+
 	def is_pressed(self, event):
 		return False
 
@@ -59,6 +62,9 @@ class KeyboardInput(InputMethod):
 	def is_cancel(self, event):
 		return event.key == pygame.K_ESCAPE
 
+	def is_profiler(self, event):
+		return event.key == pygame.K_F3
+
 	def is_pressed(self, event):
 		return event.type == pygame.KEYDOWN
 
@@ -1,7 +1,7 @@
-from pygame import sprite
 from .object import *
 from .animation import *
 from .entity import *
+from .view import *
 
 class Item(Entity):
 	def __init__(self, spritesheet, view, sounds, *position):
@@ -123,7 +123,7 @@ class Items:
 		self.view = view
 		self.sounds = sounds
 		self.items = dict()
-		self.item_sprite_group = sprite.Group()
+		self.item_sprite_group = ViewGroup(view)
 
 	def get_spritesheet_filename(self):
 		return 'items.png'
@@ -146,5 +146,12 @@ class Items:
 	def update(self, delta):
 		self.item_sprite_group.update(delta)
 
+	def hold(self):
+		for item in self.item_sprite_group:
+			item.hold()
+
+	def interpolate(self, alpha):
+		self.item_sprite_group.interpolate(alpha)
+
 	def draw(self, surface):
 		self.item_sprite_group.draw(surface)
\ No newline at end of file
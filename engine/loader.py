@@ -1,22 +1,57 @@
 import os, sys, math, pygame, pytmx
+from .mapcache import *
+from .text import *
 
 class ResourceLoader:
 	def __init__(self, config, logger):
 		self.config = config
 		self.logger = logger
+		self.map_cache = MapCache(os.path.join('maps', '.cache'))
+		self.fonts = dict()
+		self.maps = dict()
+		self.text_cache = TextCache()
+
+	def get_text_cache(self):
+		return self.text_cache
 
 	def load_font(self, filename, size):
+		if (filename, size) in self.fonts:
+			return self.fonts[filename, size]
+
 		filepath = os.path.join('data', 'fonts', filename)
 
 		try:
-			return pygame.font.Font(filepath, size)
+			font = pygame.font.Font(filepath, size)
 		except pygame.error as message:
 			self.logger.error('Cannot load font: %s' %(filename))
 			raise SystemExit(message)
 
+		self.fonts[filename, size] = font
+
+		return font
+
 	def load_map(self, filename):
+		if filename not in self.maps:
+			self.maps[filename] = self.read_map(filename)
+
+		return self.maps[filename]
+
+	def read_map(self, filename):
 		filepath = os.path.join('maps', filename)
-		return pytmx.util_pygame.load_pygame(filepath)
+
+		if not self.config.get_map_cache():
+			return pytmx.util_pygame.load_pygame(filepath)
+
+		tiled_map = self.map_cache.load(filepath)
+		if tiled_map is not None:
+			return tiled_map
+
+		try:
+			self.logger.debug('Compiling map cache for %s' % filename)
+			return self.map_cache.compile(filepath)
+		except MapCacheError as message:
+			self.logger.warn('Cannot compile map %s: %s' % (filename, message))
+			return pytmx.util_pygame.load_pygame(filepath)
 
 	def load_image(self, filename, colorkey=None):
 		filepath = os.path.join('data', 'images', filename)
@@ -0,0 +1,260 @@
+import os, sys, zlib, gzip, base64, hashlib, pickle, pygame, pytmx
+from array import array
+from xml.etree import ElementTree
+from pygame import transform, Rect
+
+MAP_CACHE_VERSION = 1
+
+GID_FLIPPED_HORIZONTALLY = 0x80000000
+GID_FLIPPED_VERTICALLY = 0x40000000
+GID_FLIPPED_DIAGONALLY = 0x20000000
+GID_MASK = 0x1fffffff
+
+class MapCacheError(Exception):
+	pass
+
+class CompiledObject:
+	def __init__(self, name, type, x, y, width, height, properties):
+		self.name = name
+		self.type = type
+		self.x = x
+		self.y = y
+		self.width = width
+		self.height = height
+		self.properties = properties
+
+class CompiledTileLayer:
+	def __init__(self, name, width, height, gids, images):
+		self.name = name
+		self.width = width
+		self.height = height
+		self.gids = gids
+		self.images = images
+
+	def tiles(self):
+		width, images = self.width, self.images
+		for index, gid in enumerate(self.gids):
+			if gid and gid in images:
+				yield index % width, index // width, images[gid]
+
+class CompiledObjectLayer(list):
+	def __init__(self, name, objects):
+		super().__init__(objects)
+		self.name = name
+
+class CompiledMap:
+	def __init__(self, data, images):
+		self.width = data['width']
+		self.height = data['height']
+		self.tilewidth = data['tilewidth']
+		self.tileheight = data['tileheight']
+		self.background_color = data['background_color']
+		self.properties = data['properties']
+		self.layers = list()
+		self.layernames = dict()
+
+		for layer in data['layers']:
+			if layer['kind'] == 'tiles':
+				gids = array('I')
+				gids.frombytes(zlib.decompress(layer['gids']))
+				compiled_layer = CompiledTileLayer(layer['name'], layer['width'], layer['height'], gids, images)
+			else:
+				compiled_layer = CompiledObjectLayer(layer['name'], [CompiledObject(**obj) for obj in layer['objects']])
+
+			self.layers.append(compiled_layer)
+			self.layernames[layer['name']] = compiled_layer
+
+	def get_layer_by_name(self, name):
+		if name not in self.layernames:
+			raise ValueError('Layer "%s" not found' % name)
+
+		return self.layernames[name]
+
+class MapCache:
+	def __init__(self, cache_dir):
+		self.cache_dir = cache_dir
+
+	def get_cache_path(self, filepath):
+		return os.path.join(self.cache_dir, '%s.cache' % os.path.basename(filepath))
+
+	def hash_file(self, path):
+		with open(path, 'rb') as f:
+			return hashlib.sha1(f.read()).hexdigest()
+
+	def describe_source(self, path):
+		stat = os.stat(path)
+		return dict(path=path, mtime=stat.st_mtime_ns, size=stat.st_size, sha1=self.hash_file(path))
+
+	def is_fresh(self, sources):
+		for source in sources:
+			path = source['path']
+			if not os.path.exists(path):
+				return False
+
+			stat = os.stat(path)
+			if stat.st_mtime_ns == source['mtime'] and stat.st_size == source['size']:
+				continue
+
+			if self.hash_file(path) != source['sha1']:
+				return False
+
+		return True
+
+	def load(self, filepath):
+		cache_path = self.get_cache_path(filepath)
+		if not os.path.exists(cache_path):
+			return None
+
+		try:
+			with open(cache_path, 'rb') as f:
+				data = pickle.load(f)
+		except Exception:
+			return None
+
+		if data.get('version') != MAP_CACHE_VERSION or not self.is_fresh(data['sources']):
+			return None
+
+		return CompiledMap(data, self.load_tile_images(os.path.dirname(filepath), data['tilesets'], data['gids']))
+
+	def compile(self, filepath):
+		root = ElementTree.parse(filepath).getroot()
+		tiled_map = pytmx.TiledMap(filepath)
+		dirname = os.path.dirname(filepath)
+
+		sources = [self.describe_source(filepath)]
+		for node in root.findall('tileset'):
+			if node.get('source') is not None:
+				sources.append(self.describe_source(os.path.join(dirname, node.get('source'))))
+
+		tilesets = list()
+		for tileset in tiled_map.tilesets:
+			if tileset.source is None:
+				raise MapCacheError('Tileset %s has no image' % tileset.name)
+
+			tilesets.append(dict(
+				firstgid = tileset.firstgid,
+				source = tileset.source,
+				tilewidth = tileset.tilewidth,
+				tileheight = tileset.tileheight,
+				spacing = tileset.spacing,
+				margin = tileset.margin,
+				trans = tileset.trans,
+			))
+
+		layer_nodes = dict((node.get('name'), node) for node in root.findall('layer'))
+		used_gids = set()
+		layers = list()
+		for layer in tiled_map.layers:
+			if isinstance(layer, pytmx.TiledTileLayer):
+				gids = self.read_layer_gids(layer_nodes[layer.name])
+				used_gids.update(gids)
+				layers.append(dict(kind='tiles', name=layer.name, width=layer.width, height=layer.height, gids=zlib.compress(gids.tobytes())))
+			elif isinstance(layer, pytmx.TiledObjectGroup):
+				layers.append(dict(kind='objects', name=layer.name, objects=[dict(
+					name = obj.name,
+					type = obj.type,
+					x = obj.x,
+					y = obj.y,
+					width = obj.width,
+					height = obj.height,
+					properties = dict(obj.properties),
+				) for obj in layer]))
+
+		used_gids.discard(0)
+
+		data = dict(
+			version = MAP_CACHE_VERSION,
+			sources = sources,
+			width = tiled_map.width,
+			height = tiled_map.height,
+			tilewidth = tiled_map.tilewidth,
+			tileheight = tiled_map.tileheight,
+			background_color = tiled_map.background_color,
+			properties = dict(tiled_map.properties),
+			tilesets = tilesets,
+			gids = sorted(used_gids),
+			layers = layers,
+		)
+
+		os.makedirs(self.cache_dir, exist_ok=True)
+		with open(self.get_cache_path(filepath), 'wb') as f:
+			pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+
+		return CompiledMap(data, self.load_tile_images(dirname, tilesets, data['gids']))
+
+	def read_layer_gids(self, node):
+		data = node.find('data')
+		encoding = data.get('encoding')
+
+		if encoding == 'csv':
+			return array('I', [int(value) for value in data.text.split(',') if value.strip()])
+		elif encoding == 'base64':
+			raw = base64.b64decode(data.text.strip())
+			compression = data.get('compression')
+			if compression == 'zlib':
+				raw = zlib.decompress(raw)
+			elif compression == 'gzip':
+				raw = gzip.decompress(raw)
+			elif compression is not None:
+				raise MapCacheError('Unsupported layer compression %s' % compression)
+
+			gids = array('I')
+			gids.frombytes(raw)
+			if sys.byteorder == 'big':
+				gids.byteswap()
+
+			return gids
+
+		raise MapCacheError('Unsupported layer encoding %s' % encoding)
+
+	def load_tile_images(self, dirname, tilesets, gids):
+		tilesets = sorted(tilesets, key=lambda tileset: tileset['firstgid'])
+		sheets = dict()
+		images = dict()
+
+		for gid in gids:
+			tile_id = gid & GID_MASK
+			tileset = None
+			for candidate in tilesets:
+				if candidate['firstgid'] <= tile_id:
+					tileset = candidate
+
+			if tileset is None:
+				continue
+
+			source = tileset['source']
+			if source not in sheets:
+				sheets[source] = self.load_tileset_image(dirname, tileset)
+
+			sheet, columns = sheets[source]
+			index = tile_id - tileset['firstgid']
+			tw, th = tileset['tilewidth'], tileset['tileheight']
+			x = tileset['margin'] + (index % columns) * (tw + tileset['spacing'])
+			y = tileset['margin'] + (index // columns) * (th + tileset['spacing'])
+
+			if x + tw > sheet.get_width() or y + th > sheet.get_height():
+				continue
+
+			image = sheet.subsurface(Rect((x, y), (tw, th)))
+
+			if gid & GID_FLIPPED_DIAGONALLY:
+				image = transform.flip(transform.rotate(image, 270), True, False)
+			if gid & (GID_FLIPPED_HORIZONTALLY | GID_FLIPPED_VERTICALLY):
+				image = transform.flip(image, bool(gid & GID_FLIPPED_HORIZONTALLY), bool(gid & GID_FLIPPED_VERTICALLY))
+
+			images[gid] = image
+
+		return images
+
+	def load_tileset_image(self, dirname, tileset):
+		image = pygame.image.load(os.path.join(dirname, tileset['source']))
+
+		if tileset['trans'] is not None:
+			image = image.convert()
+			image.set_colorkey(pygame.Color('#%s' % tileset['trans'].lstrip('#')))
+		else:
+			image = image.convert_alpha()
+
+		columns = len(range(tileset['margin'], image.get_width() + 1 - tileset['tilewidth'], tileset['tilewidth'] + tileset['spacing']))
+
+		return image, columns
@@ -1,12 +1,14 @@
 import pygame
-from pygame import display, Surface
+from pygame import Surface
 from pygame.sprite import Rect
 from .constants import *
+from .present import *
 
 class Menu:
-	def __init__(self, logger, input, loader, screen, sounds, music_player, game, **opts):
+	def __init__(self, logger, input, loader, screen, sounds, music_player, game, presenter=None, **opts):
 		self.logger = logger
 		self.screen = screen
+		self.presenter = NearestPresenter(screen) if presenter is None else presenter
 		self.input = input
 		self.buffer = Surface((int(SCREEN_W), int(SCREEN_H)))
 		self.loader = loader
@@ -15,24 +17,21 @@ class Menu:
 		self.music_player = music_player
 		self.title_font = self.loader.load_font('megaman_2.ttf', TITLE_FONT_SIZE)
 		self.prompt_font = self.loader.load_font('megaman_2.ttf', PROMPT_FONT_SIZE)
+		self.text_cache = self.loader.get_text_cache()
 		self.title = 'Game Demo'
 		self.menu_time = 0
 		self.prompt_blinking = False
+		self.starting = False
+		self.invalidated = True
+		self.prompt_drawn = None
 
 	def update(self, delta):
 		self.menu_time += delta
 
-	def render(self):
-		buffer = self.buffer
-		screen = self.screen
-		title_font = self.title_font
-		prompt_font = self.prompt_font
-		title = self.title
-
-		background_color = 0, 0, 0
-		default_font_color = 255, 255, 255
-		buffer.fill(background_color)
+	def invalidate(self):
+		self.invalidated = True
 
+	def update_blink(self):
 		if self.prompt_blinking and self.menu_time >= 0.25:
 			self.menu_time = 0
 			self.prompt_blinking = False
@@ -40,26 +39,50 @@ class Menu:
 			self.menu_time = 0
 			self.prompt_blinking = True
 
-		if self.prompt_blinking:
-			prompt_font_color = background_color
-		else:
-			prompt_font_color = default_font_color
+	def render(self, alpha=1):
+		buffer = self.buffer
+		title_font = self.title_font
+		prompt_font = self.prompt_font
 
-		title_text = title_font.render(self.title, 0, default_font_color)
-		title_rect = title_text.get_rect(center=(round(SCREEN_W/2), round(SCREEN_H/2)))
+		background_color = 0, 0, 0
+		default_font_color = 255, 255, 255
+
+		self.update_blink()
+
+		if self.invalidated:
+			buffer.fill(background_color)
+
+			title_text = self.text_cache.render(title_font, self.title, default_font_color)
+			title_rect = title_text.get_rect(center=(round(SCREEN_W/2), round(SCREEN_H/2)))
+			buffer.blit(title_text, title_rect)
+
+			self.prompt_drawn = None
 
-		prompt_text = prompt_font.render('Press Enter to start', 0, prompt_font_color)
-		prompt_rect = prompt_text.get_rect(center=(round(SCREEN_W/2), round(SCREEN_H/2) + 50))
+		# only the prompt changes between frames, so only its rect is redrawn
+		if self.prompt_drawn != self.prompt_blinking:
+			prompt_font_color = background_color if self.prompt_blinking else default_font_color
+			prompt_text = self.text_cache.render(prompt_font, 'Press Enter to start', prompt_font_color)
+			prompt_rect = prompt_text.get_rect(center=(round(SCREEN_W/2), round(SCREEN_H/2) + 50))
 
-		buffer.blit(title_text, title_rect)
-		buffer.blit(prompt_text, prompt_rect)
+			buffer.fill(background_color, prompt_rect)
+			buffer.blit(prompt_text, prompt_rect)
+			self.prompt_drawn = self.prompt_blinking
 
-		screen.blit(buffer, buffer.get_rect())
+			if self.invalidated:
+				self.presenter.present(buffer)
+			else:
+				self.presenter.present_rects(buffer, [prompt_rect])
 
-		display.flip()
+		self.invalidated = False
 
 	def start_game(self):
-		self.sounds.play_sound('start', True)
+		if self.starting:
+			return
+
+		self.starting = True
+		self.sounds.play('start', self.enter_game)
+
+	def enter_game(self):
 		self.game.set_mode(MODE_GAME)
 
 	def quit_game(self):
@@ -67,8 +90,14 @@ class Menu:
 
 	def handle_event(self, event):
 		input = self.input
+		if event.type == pygame.VIDEOEXPOSE:
+			self.invalidate()
+
+		if self.starting:
+			return
+
 		if input.is_pressed(event) or input.is_released(event):
 			if input.is_start(event):
 				self.start_game()
 			elif input.is_cancel(event):
-				self.quit_game()
\ No newline at end of file
+				self.quit_game()
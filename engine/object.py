@@ -1,3 +1,4 @@
+from array import array
 from pygame.sprite import Rect
 from pygame.math import Vector2
 
@@ -5,6 +6,7 @@ class GameObject:
 	def __init__(self, rect, name=None, attributes=dict()):
 		self.name = name
 		self.rect = rect
+		self.bounding_rect = Rect(rect)
 		self.flagged = False
 		self.attributes = attributes
 
@@ -21,7 +23,10 @@ class GameObject:
 		return self.name
 
 	def get_rect(self):
-		return Rect((self.get_left(), self.get_top()), (self.get_width(), self.get_height()))
+		if self.bounding_rect != self.rect:
+			self.bounding_rect.update(self.rect)
+
+		return self.bounding_rect
 
 	def get_position(self):
 		return Vector2(self.get_left(), self.get_top())
@@ -49,3 +54,39 @@ class GameObject:
 
 	def collides_with(self, rect):
 		return self.get_rect().colliderect(rect)
+
+class StaticObject(GameObject):
+	def __init__(self, rect, name=None, attributes=dict()):
+		super().__init__(rect, name=name, attributes=attributes)
+		self.position = Vector2(rect.left, rect.top)
+
+	def get_rect(self):
+		return self.rect
+
+	def get_position(self):
+		return self.position
+
+	def collides_with(self, rect):
+		return self.rect.colliderect(rect)
+
+class StaticLayer:
+	def __init__(self, objects=()):
+		self.objects = list()
+		self.bounds = array('i')
+
+		for obj in objects:
+			self.add(obj)
+
+	def add(self, obj):
+		rect = obj.get_rect()
+		self.objects.append(obj)
+		self.bounds.extend((rect.left, rect.top, rect.right, rect.bottom))
+
+	def get_objects(self):
+		return self.objects
+
+	def get_bounds(self):
+		return self.bounds
+
+	def __len__(self):
+		return len(self.objects)
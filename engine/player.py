@@ -38,6 +38,7 @@ class Player(Entity):
 		self.damaged = False
 		self.healing = False
 		self.healing_left = 0
+		self.refilling = False
 		self.invincible = False
 		self.immobilized = False
 
@@ -175,8 +176,15 @@ class Player(Entity):
 		if self.hit_points < self.max_hit_points:
 			self.healing = True
 			self.healing_left = hit_points
+			self.refilling = True
 
-			self.sounds.play_sound('energy', True)
+			self.sounds.play('energy', self.stop_refilling)
+
+	def is_refilling(self):
+		return self.refilling
+
+	def stop_refilling(self):
+		self.refilling = False
 
 	def add_points(self, points):
 		self.score += points
@@ -0,0 +1,154 @@
+import pygame
+from pygame import Surface, transform, display
+from pygame.sprite import Rect
+
+try:
+	from pygame._sdl2 import video as sdl2_video
+except ImportError:
+	sdl2_video = None
+
+class Presenter:
+	def __init__(self, screen):
+		self.screen = screen
+
+	def get_name(self):
+		return None
+
+	def present(self, buffer):
+		self.screen.blit(buffer, (0, 0))
+		display.flip()
+
+	def present_rects(self, buffer, rects):
+		self.present(buffer)
+
+class ScalePresenter(Presenter):
+	def __init__(self, screen):
+		super().__init__(screen)
+		self.target = None
+
+	def scale(self, buffer, size, dest):
+		transform.scale(buffer, size, dest)
+
+	def get_target(self, buffer):
+		screen = self.screen
+		# scale straight into the display surface when the pixel formats allow it
+		if buffer.get_bytesize() == screen.get_bytesize():
+			return screen
+
+		if self.target is None or self.target.get_bytesize() != buffer.get_bytesize():
+			self.target = Surface(screen.get_size(), 0, buffer)
+
+		return self.target
+
+	def present(self, buffer):
+		screen = self.screen
+
+		if buffer.get_size() == screen.get_size():
+			screen.blit(buffer, (0, 0))
+		else:
+			target = self.get_target(buffer)
+			self.scale(buffer, screen.get_size(), target)
+			if target is not screen:
+				screen.blit(target, (0, 0))
+
+		display.flip()
+
+	def present_rects(self, buffer, rects):
+		screen = self.screen
+
+		if buffer.get_size() != screen.get_size():
+			self.present(buffer)
+			return
+
+		for rect in rects:
+			screen.blit(buffer, rect, rect)
+
+		display.update(rects)
+
+class NearestPresenter(ScalePresenter):
+	def get_name(self):
+		return 'nearest'
+
+class SmoothPresenter(ScalePresenter):
+	def get_name(self):
+		return 'smooth'
+
+	def scale(self, buffer, size, dest):
+		transform.smoothscale(buffer, size, dest)
+
+class Scale2xPresenter(ScalePresenter):
+	def __init__(self, screen):
+		super().__init__(screen)
+		self.source_size = None
+		self.stages = list()
+
+	def get_name(self):
+		return 'scale2x'
+
+	def build_stages(self, buffer):
+		self.source_size = buffer.get_size()
+		self.stages = list()
+
+		w, h = self.source_size
+		sw, sh = self.screen.get_size()
+		while w * 2 <= sw and h * 2 <= sh:
+			w, h = w * 2, h * 2
+			self.stages.append(Surface((w, h), 0, buffer))
+
+	def scale(self, buffer, size, dest):
+		if self.source_size != buffer.get_size():
+			self.build_stages(buffer)
+
+		source = buffer
+		for stage in self.stages:
+			transform.scale2x(source, stage)
+			source = stage
+
+		if source.get_size() == size:
+			dest.blit(source, (0, 0))
+		else:
+			transform.scale(source, size, dest)
+
+class SDL2Presenter(Presenter):
+	def __init__(self, screen):
+		super().__init__(screen)
+		self.window = sdl2_video.Window.from_display_module()
+		self.renderer = sdl2_video.Renderer(self.window, accelerated=0)
+		self.texture = None
+		self.dest = Rect((0, 0), screen.get_size())
+
+	def get_name(self):
+		return 'sdl2'
+
+	def present(self, buffer):
+		if self.texture is None or self.texture.get_rect().size != buffer.get_size():
+			self.texture = sdl2_video.Texture(self.renderer, buffer.get_size(), streaming=True)
+
+		self.texture.update(buffer)
+		self.renderer.clear()
+		self.texture.draw(dstrect=self.dest)
+		self.renderer.present()
+
+PRESENTERS = dict(
+	nearest = NearestPresenter,
+	smooth = SmoothPresenter,
+	scale2x = Scale2xPresenter,
+	sdl2 = SDL2Presenter,
+)
+
+def create_presenter(mode, screen, logger):
+	if mode not in PRESENTERS:
+		raise SystemExit('Invalid present mode %s' % mode)
+
+	if mode == 'sdl2':
+		if sdl2_video is None:
+			logger.warn('pygame._sdl2 is not available, presenting with nearest')
+			return NearestPresenter(screen)
+
+		try:
+			return SDL2Presenter(screen)
+		except pygame.error as message:
+			logger.warn('Cannot create SDL2 renderer: %s' % message)
+			return NearestPresenter(screen)
+
+	return PRESENTERS[mode](screen)
@@ -0,0 +1,108 @@
+from collections import deque
+from time import perf_counter_ns
+from pygame import draw, Rect
+from .constants import *
+
+PROFILER_COLORS = [
+	(230, 25, 75), (60, 180, 75), (255, 225, 25), (0, 130, 200), (245, 130, 48), (145, 30, 180), (70, 240, 240),
+	(240, 50, 230), (210, 245, 60), (250, 190, 212), (0, 128, 128), (220, 190, 255), (170, 110, 40), (255, 250, 200),
+]
+
+class FrameProfiler:
+	def __init__(self, window=PROFILER_WINDOW):
+		self.window = window
+		self.samples = dict()
+		self.phases = list()
+		self.stats = dict()
+		self.frames = 0
+
+	def get_phases(self):
+		return self.phases
+
+	def record(self, phase, elapsed):
+		if phase not in self.samples:
+			self.samples[phase] = deque(maxlen=self.window)
+			self.phases.append(phase)
+
+		self.samples[phase].append(elapsed)
+
+	def run(self, phase, fn, *args):
+		start = perf_counter_ns()
+		result = fn(*args)
+		self.record(phase, perf_counter_ns() - start)
+
+		return result
+
+	def percentile(self, phase, q):
+		samples = sorted(self.samples[phase]) if phase in self.samples else []
+		if len(samples) == 0:
+			return 0
+
+		return samples[int(q * (len(samples) - 1))]
+
+	def end_frame(self):
+		self.frames += 1
+		if self.frames % PROFILER_REFRESH_FRAMES == 0:
+			self.stats = dict((phase, (self.percentile(phase, 0.5), self.percentile(phase, 0.95), self.percentile(phase, 0.99))) for phase in self.phases)
+
+	def get_stats(self):
+		return self.stats
+
+class ProfilerOverlay:
+	def __init__(self, profiler, font):
+		self.profiler = profiler
+		self.font = font
+		self.visible = False
+		self.stats = None
+		self.labels = [font.render(name, False, (255, 255, 255)) for name in ['p50', 'p95', 'p99']]
+		self.legend = list()
+
+	def is_visible(self):
+		return self.visible
+
+	def toggle(self):
+		self.visible = not self.visible
+
+	def update_legend(self, stats):
+		self.stats = stats
+		self.legend = [self.font.render('%s %.2f' % (phase, stats[phase][0] / 1e6), False, (255, 255, 255)) for phase in self.profiler.get_phases() if phase in stats]
+
+	def draw(self, surface):
+		if not self.visible:
+			return
+
+		stats = self.profiler.get_stats()
+		if len(stats) == 0:
+			return
+
+		if stats is not self.stats:
+			self.update_legend(stats)
+
+		phases = [phase for phase in self.profiler.get_phases() if phase in stats]
+		budget_ns = 1e9 / FPS
+		width, height = surface.get_size()
+		left, bar_width, bar_height = 32, width - 40, 6
+		bars_height = 3 * (bar_height + 2)
+		top = height - bars_height - 4 - (((len(phases) + 1) // 2) * 9)
+
+		draw.rect(surface, (0, 0, 0), Rect((0, top - 2), (width, height - top + 2)))
+
+		for row, label in enumerate(self.labels):
+			y = top + row * (bar_height + 2)
+			surface.blit(label, (4, y - 1))
+
+			x = left
+			for index, phase in enumerate(phases):
+				segment = min(int(bar_width * stats[phase][row] / budget_ns), width - x)
+				if segment > 0:
+					draw.rect(surface, PROFILER_COLORS[index % len(PROFILER_COLORS)], Rect((x, y), (segment, bar_height)))
+					x += segment
+
+		draw.line(surface, (255, 255, 255), (left + bar_width, top - 1), (left + bar_width, top + bars_height))
+
+		legend_top = top + bars_height + 2
+		for index, label in enumerate(self.legend):
+			x = 4 + (index % 2) * int(width / 2)
+			y = legend_top + (index // 2) * 9
+			draw.rect(surface, PROFILER_COLORS[index % len(PROFILER_COLORS)], Rect((x, y + 1), (6, 6)))
+			surface.blit(label, (x + 9, y))
@@ -0,0 +1,19 @@
+class ProjectilePool:
+	def __init__(self, projectile_class, capacity):
+		self.capacity = capacity
+		self.free = [projectile_class(self) for _ in range(capacity)]
+
+	def get_capacity(self):
+		return self.capacity
+
+	def get_free_count(self):
+		return len(self.free)
+
+	def get_active_count(self):
+		return self.capacity - len(self.free)
+
+	def acquire(self):
+		return self.free.pop() if len(self.free) > 0 else None
+
+	def release(self, projectile):
+		self.free.append(projectile)
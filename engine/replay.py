@@ -0,0 +1,90 @@
+import json, pygame
+from .constants import *
+
+class InputRecording:
+	def __init__(self, seed=None, events=None, ticks=0):
+		self.seed = seed
+		self.events = list() if events is None else events
+		self.ticks = ticks
+
+	def get_seed(self):
+		return self.seed
+
+	def get_length(self):
+		return self.ticks
+
+	def set_length(self, ticks):
+		self.ticks = ticks
+
+	def add(self, tick, event):
+		self.events.append((tick, event.type, event.key))
+
+	def save(self, filename):
+		with open(filename, 'w') as f:
+			json.dump(dict(fps=FPS, seed=self.seed, ticks=self.ticks, events=self.events), f)
+
+	@classmethod
+	def load(cls, filename):
+		with open(filename) as f:
+			data = json.load(f)
+
+		if data['fps'] != FPS:
+			raise SystemExit('Recording %s was made at %d ticks per second' % (filename, data['fps']))
+
+		return cls(data['seed'], [tuple(event) for event in data['events']], data['ticks'])
+
+class InputRecorder:
+	def __init__(self, filename, logger):
+		self.filename = filename
+		self.logger = logger
+		self.recording = None
+		self.tick = 0
+
+	def is_recording(self):
+		return self.recording is not None
+
+	def start(self, seed):
+		self.recording = InputRecording(seed)
+		self.tick = 0
+
+	def record(self, event):
+		if self.recording is not None and event.type in (pygame.KEYDOWN, pygame.KEYUP):
+			self.recording.add(self.tick, event)
+
+	def advance(self):
+		self.tick += 1
+
+	def stop(self):
+		if self.recording is None:
+			return
+
+		self.recording.set_length(self.tick)
+		self.recording.save(self.filename)
+		self.logger.debug('Recorded %d events over %d ticks to %s' % (len(self.recording.events), self.tick, self.filename))
+		self.recording = None
+
+class InputPlayer:
+	def __init__(self, filename):
+		self.recording = InputRecording.load(filename)
+		self.tick = 0
+		self.index = 0
+
+	def get_seed(self):
+		return self.recording.get_seed()
+
+	def start(self):
+		self.tick = 0
+		self.index = 0
+
+	def is_finished(self):
+		return self.tick >= self.recording.get_length()
+
+	def next_events(self):
+		events = self.recording.events
+		while self.index < len(events) and events[self.index][0] <= self.tick:
+			_, type, key = events[self.index]
+			self.index += 1
+			yield pygame.event.Event(type, key=key)
+
+	def advance(self):
+		self.tick += 1
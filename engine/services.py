@@ -0,0 +1,73 @@
+import pygame
+from .constants import *
+from .input import *
+from .sound import *
+from .sprite import *
+from .present import *
+
+class Services:
+	def __init__(self, config, logger, loader):
+		self.config = config
+		self.logger = logger
+		self.loader = loader
+		self.initialized = False
+
+		self.screen = None
+		self.presenter = None
+		self.mixer = None
+		self.sounds = None
+		self.music_player = None
+		self.input = None
+		self.spritesheet_loader = None
+
+	def is_initialized(self):
+		return self.initialized
+
+	def init(self):
+		if self.initialized:
+			return
+
+		self.init_screen()
+		self.init_audio()
+		self.init_input()
+		self.spritesheet_loader = SpriteSheetLoader(self.loader)
+		self.initialized = True
+
+	def init_screen(self):
+		self.resolution = width, height = self.config.get_screen_resolution()
+		self.logger.debug('resolution: %dx%d' % (width, height))
+		self.screen = pygame.display.set_mode(self.resolution, pygame.HWSURFACE|pygame.DOUBLEBUF)
+		self.presenter = create_presenter(self.config.get_present_mode(), self.screen, self.logger)
+
+	def init_audio(self):
+		if self.config.get_headless():
+			self.mixer = None
+			self.sounds = NullSoundLibrary()
+			self.music_player = NullMusicPlayer()
+			return
+
+		self.mixer = pygame.mixer.init()
+		self.sounds = SoundLibrary(self.loader, self.mixer)
+		self.sounds.load()
+		self.music_player = MusicPlayer(self.loader)
+
+	def init_input(self):
+		self.input = KeyboardInput()
+
+	def get_screen(self):
+		return self.screen
+
+	def get_presenter(self):
+		return self.presenter
+
+	def get_sounds(self):
+		return self.sounds
+
+	def get_music_player(self):
+		return self.music_player
+
+	def get_input(self):
+		return self.input
+
+	def get_spritesheet_loader(self):
+		return self.spritesheet_loader
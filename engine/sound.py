@@ -1,10 +1,122 @@
-from pygame import time, mixer
+from pygame import mixer, event
+from .constants import *
+
+SOUND_CATEGORIES = dict(
+	ui = dict(channels=2, sounds=['start', 'defeat', 'pause', 'warp', 'extralife', 'energy', 'bonus']),
+	player = dict(channels=3, sounds=['buster', 'damage', 'land']),
+	enemy = dict(channels=3, sounds=['edamage', 'eshoot', 'dink']),
+)
+
+SOUND_MAX_VOICES = dict(
+	buster = 2,
+	eshoot = 2,
+	edamage = 2,
+)
+
+class ChannelGroup:
+	def __init__(self, channels):
+		self.channels = channels
+		self.order = list(channels)
+
+	def get_oldest(self, channels):
+		for channel in self.order:
+			if channel in channels:
+				return channel
+
+		return channels[0]
+
+	def find_channel(self, sound, max_voices):
+		voices = [channel for channel in self.channels if channel.get_busy() and channel.get_sound() is sound]
+		if len(voices) >= max_voices:
+			return self.get_oldest(voices)
+
+		for channel in self.channels:
+			if not channel.get_busy():
+				return channel
+
+		return self.get_oldest(self.channels)
+
+	def play(self, sound, max_voices):
+		channel = self.find_channel(sound, max_voices)
+		channel.play(sound)
+		self.order.remove(channel)
+		self.order.append(channel)
+
+		return channel
+
+class SoundMixer:
+	def __init__(self, categories=SOUND_CATEGORIES, max_voices=SOUND_MAX_VOICES):
+		self.max_voices = max_voices
+		self.groups = dict()
+		self.played = dict()
+
+		reserved = sum(category['channels'] for category in categories.values())
+		mixer.set_num_channels(reserved + mixer.get_num_channels())
+		mixer.set_reserved(reserved)
+
+		index = 0
+		for category in categories.values():
+			group = ChannelGroup([mixer.Channel(i) for i in range(index, index + category['channels'])])
+			index += category['channels']
+			for name in category['sounds']:
+				self.groups[name] = group
+
+	def play(self, name, sound):
+		if name in self.played:
+			return self.played[name]
+
+		if name in self.groups:
+			channel = self.groups[name].play(sound, self.max_voices[name] if name in self.max_voices else 1)
+		else:
+			channel = sound.play()
+
+		self.played[name] = channel
+
+		return channel
+
+	def tick(self):
+		if len(self.played) > 0:
+			self.played = dict()
+
+class SoundHandle:
+	def __init__(self, name, sound, channel, callback=None, notify=False):
+		self.name = name
+		self.sound = sound
+		self.channel = channel
+		self.callback = callback
+		self.notify = notify
+		self.finished = False
+
+	def get_name(self):
+		return self.name
+
+	def is_finished(self):
+		return self.finished
+
+	def is_playing(self):
+		channel = self.channel
+		return channel is not None and channel.get_busy() and channel.get_sound() is self.sound
+
+	def stop(self):
+		if self.is_playing():
+			self.channel.stop()
+
+	def finish(self):
+		self.finished = True
+
+		if self.notify:
+			event.post(event.Event(SOUND_FINISHED, sound=self.name))
+
+		if self.callback is not None:
+			self.callback()
 
 class SoundLibrary:
 	def __init__(self, loader, mixer):
 		self.loader = loader
 		self.sounds = {}
 		self.mixer = mixer
+		self.handles = []
+		self.sound_mixer = None
 
 	def load(self):
 		load_sound = self.loader.load_sound
@@ -24,20 +136,72 @@ class SoundLibrary:
 			extralife=load_sound('1up.wav', self.mixer),
 		)
 
-	def play_sound(self, sound, blocking=False, end_event=None):
+		if mixer.get_init():
+			self.sound_mixer = SoundMixer()
+
+	def play_channel(self, sound):
+		if self.sound_mixer is None:
+			return self.sounds[sound].play()
+
+		return self.sound_mixer.play(sound, self.sounds[sound])
+
+	def play(self, sound, callback=None, notify=False):
+		channel = self.play_channel(sound)
+		if channel is not None:
+			channel.set_endevent()
+
+		handle = SoundHandle(sound, self.sounds[sound], channel, callback, notify)
+		if callback is not None or notify:
+			self.handles.append(handle)
+
+		return handle
+
+	def tick(self):
+		if self.sound_mixer is not None:
+			self.sound_mixer.tick()
+
+	def update(self):
+		if len(self.handles) == 0:
+			return
+
+		finished = [handle for handle in self.handles if not handle.is_playing()]
+		if len(finished) == 0:
+			return
+
+		self.handles = [handle for handle in self.handles if handle not in finished]
+		for handle in finished:
+			handle.finish()
+
+	def play_sound(self, sound, end_event=None):
 		# print('Playing sound %s'%sound)
-		if blocking:
-			channel = self.sounds[sound].play()
-			while channel.get_busy():
-				time.wait(100)
-		else:
-			channel = self.sounds[sound].play()
+		channel = self.play_channel(sound)
 
-		# print(channel)
+		if channel is None:
+			return
 
+		# channels outlive mode switches, so clear any end event left by an earlier sound
 		if end_event is not None:
 			channel.set_endevent(end_event)
-			# self.sounds[sound].play()
+		else:
+			channel.set_endevent()
+
+class NullSoundLibrary(SoundLibrary):
+	def __init__(self):
+		super().__init__(None, None)
+
+	def load(self):
+		pass
+
+	def play(self, sound, callback=None, notify=False):
+		handle = SoundHandle(sound, None, None, callback, notify)
+		if callback is not None or notify:
+			self.handles.append(handle)
+
+		return handle
+
+	def play_sound(self, sound, end_event=None):
+		if end_event is not None:
+			event.post(event.Event(end_event))
 
 class MusicPlayer:
 	def __init__(self, loader):
@@ -57,3 +221,19 @@ class MusicPlayer:
 
 	def unpause(self):
 		mixer.music.unpause()
+
+class NullMusicPlayer(MusicPlayer):
+	def __init__(self):
+		super().__init__(None)
+
+	def play(self, song):
+		pass
+
+	def stop(self):
+		pass
+
+	def pause(self):
+		pass
+
+	def unpause(self):
+		pass
@@ -0,0 +1,39 @@
+from bisect import bisect_left, bisect_right
+
+class SpawnIndex:
+	def __init__(self):
+		self.points = dict()
+		self.zones = dict()
+		self.dirty = False
+
+	def add(self, zone_name, name, x):
+		if zone_name in self.points:
+			self.points[zone_name].append((x, len(self.points[zone_name]), name))
+		else:
+			self.points[zone_name] = [(x, 0, name)]
+
+		self.dirty = True
+
+	def build(self):
+		self.zones = dict()
+		for zone_name, points in self.points.items():
+			points.sort()
+			self.zones[zone_name] = ([x for x, _, _ in points], [name for _, _, name in points])
+
+		self.dirty = False
+
+	def get_count(self, zone_name=None):
+		if zone_name is None:
+			return sum(len(points) for points in self.points.values())
+
+		return len(self.points[zone_name]) if zone_name in self.points else 0
+
+	def query(self, zone_name, left, right):
+		if self.dirty:
+			self.build()
+
+		if zone_name not in self.zones:
+			return []
+
+		xs, names = self.zones[zone_name]
+		return names[bisect_left(xs, left):bisect_right(xs, right)]
@@ -1,27 +1,102 @@
-from pygame import Surface, transform, RLEACCEL, SRCALPHA, sprite
+from pygame import Surface, Rect, transform, RLEACCEL, SRCALPHA, sprite
+from .constants import *
+
+class FrameCache:
+	def __init__(self):
+		self.frames = dict()
+		self.hits = 0
+		self.misses = 0
+
+	def get(self, key):
+		if key in self.frames:
+			self.hits += 1
+			return self.frames[key]
+
+		self.misses += 1
+		return None
+
+	def set(self, key, image):
+		self.frames[key] = image
+
+	def get_stats(self):
+		return dict(frames=len(self.frames), hits=self.hits, misses=self.misses)
+
+	def __repr__(self):
+		return 'FrameCache(frames=%d, hits=%d, misses=%d)' % (len(self.frames), self.hits, self.misses)
 
 class SpriteSheet:
-	def __init__(self, image, rect):
+	def __init__(self, image, rect, filename=None, frame_cache=None):
 		self.image = image
 		self.rect = rect
+		self.filename = filename
+		self.frame_cache = frame_cache
+		self.variants = {None: image}
+
+	def bake(self, flips=SPRITE_SHEET_FLIPS):
+		for flip in flips:
+			self.get_variant(flip)
+
+	def bake_variant(self, flip):
+		if flip == 'x':
+			return transform.flip(self.image, True, False)
+		elif flip == 'y':
+			return transform.flip(self.image, False, True)
+
+		return self.image
+
+	def get_variant(self, flip):
+		key = flip or None
+		if key not in self.variants:
+			self.variants[key] = self.bake_variant(key)
+
+		return self.variants[key]
+
+	def get_variant_rect(self, rect, flip):
+		x, y, width, height = rect.x, rect.y, rect.width, rect.height
+
+		# a flipped sheet holds each frame at the mirrored position
+		if flip == 'x':
+			x = self.rect.width - x - width
+		elif flip == 'y':
+			y = self.rect.height - y - height
+
+		return Rect(x, y, width, height)
+
+	def get_colorkey_at(self, rect):
+		# outside the sheet the sliced surface keeps its zero fill
+		if self.rect.collidepoint(rect.x, rect.y):
+			return self.image.get_at((rect.x, rect.y))
+
+		return 0, 0, 0
 
 	def image_at(self, rect, colorkey=None, scale2x=False, flip=False, alpha=False):
+		if self.frame_cache is None:
+			return self.slice_image(rect, colorkey, scale2x, flip, alpha)
+
+		key = (self.filename, rect.x, rect.y, rect.width, rect.height, flip or None, colorkey if colorkey is None or colorkey == -1 else tuple(colorkey), alpha, scale2x)
+		image = self.frame_cache.get(key)
+		if image is None:
+			image = self.slice_image(rect, colorkey, scale2x, flip, alpha)
+			self.frame_cache.set(key, image)
+
+		return image
+
+	def slice_image(self, rect, colorkey=None, scale2x=False, flip=False, alpha=False):
+		source = self.get_variant(flip)
+		area = self.get_variant_rect(rect, flip)
+
 		if alpha:
-			image = Surface(rect.size, SRCALPHA)
-			image.blit(self.image, (0, 0), rect)
+			image = Surface(area.size, SRCALPHA)
+			image.blit(source, (0, 0), area)
 		else:
-			image = Surface(rect.size).convert()
-			image.blit(self.image, (0, 0), rect)
+			image = Surface(area.size).convert()
+			image.blit(source, (0, 0), area)
 			if colorkey is not None:
 				if colorkey == -1:
-					colorkey = image.get_at((0,0))
+					colorkey = self.get_colorkey_at(rect)
 				image.set_colorkey(colorkey, RLEACCEL)
 
-		if flip == 'x':
-			image = transform.flip(image, True, False)
-		elif flip == 'y':
-			image = transform.flip(image, False, True)
-
+		# scaled per frame so scale2x never samples a neighbouring frame's pixels
 		if scale2x:
 			image = transform.scale2x(image)
 
@@ -34,10 +109,20 @@ class SpriteSheet:
 class SpriteSheetLoader:
 	def __init__(self, loader):
 		self.loader = loader
+		self.frame_cache = FrameCache()
+		self.sheets = dict()
+
+	def get_frame_cache(self):
+		return self.frame_cache
 
 	def load(self, filename):
-		image, rect = self.loader.load_image(filename)
-		return SpriteSheet(image, rect)
+		if filename not in self.sheets:
+			image, rect = self.loader.load_image(filename)
+			sheet = SpriteSheet(image, rect, filename, self.frame_cache)
+			sheet.bake()
+			self.sheets[filename] = sheet
+
+		return self.sheets[filename]
 
 # class Sprite(sprite.Sprite):
 # 	def get_spritesheet_filename(self):
@@ -11,31 +11,41 @@ from .item import *
 from .hazards import Hazards
 from .gate import Gates
 from .zone import *
+from .grid import *
 
 class Stage:
-	def __init__(self, config, loader, spritesheet_loader, view, sounds, explosions):
+	def __init__(self, config, loader, spritesheet_loader, view, sounds, explosions, seed=None):
 		self.config = config
 		self.loader = loader
 		self.spritesheet_loader = spritesheet_loader
 		self.player = None
 		self.map = None
 		self.zone = None
-		self.tiles = {}
+		self.tile_chunks = TileChunks(view)
 		self.zones = {}
 		self.ladders = {}
 		self.platforms = {}
+		self.platform_outlines = []
 		self.hazards = {}
+		self.platform_grid = SpatialGrid()
+		self.ladder_grid = SpatialGrid()
+		self.hazard_grid = SpatialGrid()
+		self.zone_index = ZoneIndex()
+		self.platform_layer = None
+		self.ladder_layer = None
+		self.hazard_layer = None
+		self.zone_layer = None
 		self.items = None
 		self.gates = None
 		self.enemies = None
 		self.explosions = explosions
-		self.tile_sprite_group = sprite.Group()
 		self.enemy_sprite_group = sprite.Group()
 		self.map_size = None
 		self.sounds = sounds
 		self.music_track = None
 		self.start_zone = None
 		self.view = view
+		self.seed = seed
 
 		self.warp_start_position = Vector2(0, 0)
 		self.warp_land_position = Vector2(0, 0)
@@ -73,18 +83,14 @@ class Stage:
 
 	def load_tiles(self):
 		if not self.debug['map_debug']:
-			for x, y, image in self.map.get_layer_by_name('tiles').tiles():
-				rect = image.get_rect()
-				width, height = rect.width, rect.height
-				position = x * width, y * height
-				tile = Tile(image, self, position[0], position[1])
-				self.tiles[x, y] = tile
-				self.tile_sprite_group.add(tile)
+			self.tile_chunks.bake(self.map.get_layer_by_name('tiles').tiles())
 
 	def load_zones(self):
 		for obj in self.map.get_layer_by_name('zones'):
 			x, y, width, height = int(obj.x), int(obj.y), int(obj.width), int(obj.height)
 			self.zones[obj.name] = Zone(Rect((x, y), (width, height)), obj.name, **obj.properties)
+		self.zone_index.build(self.zones.values())
+		self.zone_layer = StaticLayer(self.zones.values())
 
 		if self.debug['start_zone'] is not None:
 			zone_name = self.debug['start_zone']
@@ -92,32 +98,67 @@ class Stage:
 			zone_name = self.start_zone
 
 		self.zone = self.zones[zone_name]
-		self.view.set_offset(self.zone.get_position())
+		self.view.set_offset(Vector2(self.zone.get_position()))
 
 	def load_platforms(self):
+		rects = []
 		for obj in self.map.get_layer_by_name('platforms'):
 			x, y, width, height = int(obj.x), int(obj.y), int(obj.width), int(obj.height)
-			self.platforms[x, y] = GameObject(Rect((x, y), (width, height)))
+			rects.append(Rect((x, y), (width, height)))
+
+		for span in merge_adjacent_rects(rects):
+			self.platforms[span.left, span.top] = StaticObject(span)
+
+		self.platform_layer = StaticLayer(self.platforms.values())
+		self.platform_grid.insert_layer(self.platform_layer)
+
+		for rect in rects:
+			platform = next(platform for platform in self.platform_grid.query(rect) if platform.rect.union(rect) == platform.rect)
+			self.platform_outlines.append((rect, platform))
 
 	def get_platforms(self):
 		return self.platforms.values()
 
+	def get_platform_layer(self):
+		return self.platform_layer
+
 	def load_ladders(self):
 		for obj in self.map.get_layer_by_name('ladders'):
 			x, y, width, height = int(obj.x), int(obj.y), int(obj.width), int(obj.height)
-			self.ladders[x, y] = GameObject(Rect((x, y), (width, height)))
+			self.ladders[x, y] = StaticObject(Rect((x, y), (width, height)))
+
+		self.ladder_layer = StaticLayer(self.ladders.values())
+		self.ladder_grid.insert_layer(self.ladder_layer)
 
 	def get_ladders(self):
 		return self.ladders.values()
 
+	def get_ladder_layer(self):
+		return self.ladder_layer
+
 	def load_hazards(self):
 		for obj in self.map.get_layer_by_name('hazards'):
 			x, y, width, height = int(obj.x), int(obj.y), int(obj.width), int(obj.height)
 			self.hazards[x, y] = Hazards.load(obj.type, Rect((x, y), (width, height)))
 
+		self.hazard_layer = StaticLayer(self.hazards.values())
+		self.hazard_grid.insert_layer(self.hazard_layer)
+
 	def get_hazards(self):
 		return self.hazards.values()
 
+	def get_hazard_layer(self):
+		return self.hazard_layer
+
+	def colliding_platforms(self, rect):
+		return self.platform_grid.colliding(rect)
+
+	def colliding_ladders(self, rect):
+		return self.ladder_grid.colliding(rect)
+
+	def colliding_hazards(self, rect):
+		return self.hazard_grid.colliding(rect)
+
 	def load_gates(self):
 		self.gates = Gates(self.spritesheet_loader, self.sounds, self.view)
 		for obj in self.map.get_layer_by_name('gates'):
@@ -137,10 +178,11 @@ class Stage:
 		return self.items
 
 	def load_enemies(self):
-		self.enemies = Enemies(self.spritesheet_loader, self.sounds, self.view, self, self.explosions, self.items)
+		self.enemies = Enemies(self.spritesheet_loader, self.sounds, self.view, self, self.explosions, self.items, self.seed)
 		for obj in self.map.get_layer_by_name('enemies'):
 			x, y = int(obj.x), int(obj.y)
 			self.enemies.load(obj.name, obj.type, x, y, **obj.properties)
+		self.enemies.build_spawn_index()
 
 	def get_enemies(self):
 		return self.enemies
@@ -151,21 +193,23 @@ class Stage:
 	def get_zone(self):
 		return self.zone
 
+	def get_zones(self):
+		return self.zones.values()
+
+	def get_zone_layer(self):
+		return self.zone_layer
+
 	def set_zone(self, zone_name):
 		self.zone = self.zones[zone_name]
 
 	def in_zone(self, player):
-		prect = player.get_rect()
-		colliding_zones = list(filter((lambda zone: prect.colliderect(zone.rect)), self.zones.values()))
+		return self.zone_index.locate(player.get_rect(), self.zone)
 
-		if len(colliding_zones) == 0:
-			return None
+	def get_zone_neighbours(self, zone):
+		return self.zone_index.get_neighbours(zone)
 
-		if len(colliding_zones) == 1:
-			return colliding_zones[0]
-		elif len(colliding_zones) > 1:
-			next_zone = list(filter((lambda zone: zone.get_name() != self.zone.get_name()), colliding_zones))[0]
-			return next_zone
+	def get_transition_axis(self, from_zone, to_zone):
+		return self.zone_index.get_axis(from_zone, to_zone)
 
 	def get_zone_size(self):
 		return self.zone.get_size()
@@ -193,46 +237,45 @@ class Stage:
 
 	def platform_left_adjacent(self, rect):
 		test_rect = Rect((rect.left - 1, rect.top), (rect.width, rect.height))
-		colliding_platforms = list(filter((lambda platform: test_rect.colliderect(platform.rect)), self.platforms.values()))
+		colliding_platforms = self.colliding_platforms(test_rect)
 
 		return colliding_platforms[0] if len(colliding_platforms) > 0 else None
 
 	def platform_right_adjacent(self, rect):
 		test_rect = Rect((rect.right + 1, rect.top), (rect.width, rect.height))
-		colliding_platforms = list(filter((lambda platform: test_rect.colliderect(platform.rect)), self.platforms.values()))
+		colliding_platforms = self.colliding_platforms(test_rect)
 
 		return colliding_platforms[0] if len(colliding_platforms) > 0 else None
 
 	def platform_below(self, rect):
 		test_rect = Rect((rect.left, rect.top + 1), (rect.width, rect.height))
-		colliding_platforms = list(filter((lambda platform: test_rect.colliderect(platform.rect)), self.platforms.values()))
+		colliding_platforms = self.colliding_platforms(test_rect)
 
 		return colliding_platforms[0] if len(colliding_platforms) > 0 else None
 
 	def ladder_below(self, rect):
 		test_rect = Rect((rect.left, rect.top + 1), (rect.width, rect.height))
-		colliding_ladders = list(filter((lambda ladder: test_rect.colliderect(ladder.rect)), self.ladders.values()))
+		colliding_ladders = self.colliding_ladders(test_rect)
 
 		return colliding_ladders[0] if len(colliding_ladders) > 0 else None
 
 	def ladder_behind(self, rect):
-		colliding_ladders = list(filter((lambda ladder: rect.colliderect(ladder.rect)), self.ladders.values()))
+		colliding_ladders = self.colliding_ladders(rect)
 
 		return colliding_ladders[0] if len(colliding_ladders) > 0 else None
 
 	def update(self, delta):
-		self.tile_sprite_group.update(delta)
+		pass
 
 	def draw(self, surface):
-		self.tile_sprite_group.draw(surface)
+		self.tile_chunks.draw(surface)
 
 		if self.debug['map_debug']:
 			view = self.view
 			offset = view.get_offset()
 
-			for platform in self.platforms.values():
-				prect = platform.get_rect()
-				pvrect = Rect((prect.left - offset.x, prect.top - offset.y), (platform.get_width(), platform.get_height()))
+			for prect, platform in self.platform_outlines:
+				pvrect = Rect((prect.left - offset.x, prect.top - offset.y), (prect.width, prect.height))
 				if platform.is_flagged():
 					color = (255, 255, 0)
 				else:
@@ -0,0 +1,36 @@
+from collections import OrderedDict
+from .constants import *
+
+class TextCache:
+	def __init__(self, capacity=TEXT_CACHE_SIZE):
+		self.capacity = capacity
+		self.surfaces = OrderedDict()
+		self.hits = 0
+		self.misses = 0
+
+	def render(self, font, text, color, antialias=False):
+		key = font, text, tuple(color), bool(antialias)
+		surfaces = self.surfaces
+
+		if key in surfaces:
+			self.hits += 1
+			surfaces.move_to_end(key)
+			return surfaces[key]
+
+		self.misses += 1
+		surface = font.render(text, antialias, color)
+		surfaces[key] = surface
+
+		if len(surfaces) > self.capacity:
+			surfaces.popitem(last=False)
+
+		return surface
+
+	def get_stats(self):
+		return dict(hits=self.hits, misses=self.misses, size=len(self.surfaces))
+
+	def clear(self):
+		self.surfaces.clear()
+
+	def __repr__(self):
+		return 'TextCache(hits=%d, misses=%d, size=%d)' % (self.hits, self.misses, len(self.surfaces))
@@ -1,5 +1,7 @@
-from pygame import sprite
+import math
+from pygame import sprite, Surface, SRCALPHA
 from pygame.math import Vector2
+from .constants import *
 
 class Tile(sprite.Sprite):
 	def __init__(self, image, stage, *grid_position):
@@ -37,3 +39,45 @@ class Tile(sprite.Sprite):
 		p = self.position
 		offset = self.stage.get_view().get_offset()
 		self.rect.topleft = int(p.x - offset.x), int(p.y - offset.y)
+
+class TileChunks:
+	def __init__(self, view, chunk_width=TILE_CHUNK_WIDTH, chunk_height=TILE_CHUNK_HEIGHT):
+		self.view = view
+		self.chunk_width = chunk_width
+		self.chunk_height = chunk_height
+		self.chunks = dict()
+
+	def get_chunk(self, cx, cy):
+		return self.chunks[cx, cy] if (cx, cy) in self.chunks else None
+
+	def bake(self, tiles):
+		cw, ch = self.chunk_width, self.chunk_height
+
+		for x, y, image in tiles:
+			rect = image.get_rect()
+			left, top = x * rect.width, y * rect.height
+			cx, cy = left // cw, top // ch
+
+			chunk = self.get_chunk(cx, cy)
+			if chunk is None:
+				chunk = Surface((cw, ch), SRCALPHA)
+				self.chunks[cx, cy] = chunk
+
+			chunk.blit(image, (left - (cx * cw), top - (cy * ch)))
+
+		for key, chunk in self.chunks.items():
+			self.chunks[key] = chunk.convert_alpha()
+
+	def draw(self, surface):
+		view = self.view
+		offset = view.get_render_offset()
+		cw, ch = self.chunk_width, self.chunk_height
+		# floor, not truncate, so chunks left of or above the view stay aligned with their neighbours
+		left, top = math.floor(offset.x), math.floor(offset.y)
+		right, bottom = left + view.get_width() - 1, top + view.get_height() - 1
+
+		for cy in range(top // ch, (bottom // ch) + 1):
+			for cx in range(left // cw, (right // cw) + 1):
+				chunk = self.get_chunk(cx, cy)
+				if chunk is not None:
+					surface.blit(chunk, ((cx * cw) - left, (cy * ch) - top))
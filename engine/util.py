@@ -1,3 +1,4 @@
+from pygame import Rect
 from pygame.math import Vector2
 import math
 
@@ -10,10 +11,39 @@ def hex_to_rgb(value):
 
 	return tuple(int(value[i:i + lv // 3], 16) for i in range(0, lv, lv // 3))
 
-def calculate_velocity(speed, angle):
+def calculate_velocity_components(speed, angle):
 	radians = math.radians(angle)
-	vx = speed * math.cos(radians)
-	vy = speed * math.sin(radians)
+	return speed * math.cos(radians), speed * math.sin(radians)
+
+def calculate_velocity(speed, angle):
+	vx, vy = calculate_velocity_components(speed, angle)
 
 	return Vector2(vx, vy)
 
+def merge_rects_pass(rects, horizontal):
+	# sorting puts mergeable neighbours next to each other, so one sweep joins each run
+	if horizontal:
+		key = lambda rect: (rect.top, rect.height, rect.left)
+		adjacent = lambda a, b: a.top == b.top and a.height == b.height and a.right == b.left
+	else:
+		key = lambda rect: (rect.left, rect.width, rect.top)
+		adjacent = lambda a, b: a.left == b.left and a.width == b.width and a.bottom == b.top
+
+	merged = []
+	for rect in sorted(rects, key=key):
+		if len(merged) > 0 and adjacent(merged[-1], rect):
+			merged[-1] = merged[-1].union(rect)
+		else:
+			merged.append(Rect(rect))
+
+	return merged
+
+def merge_adjacent_rects(rects):
+	spans = [Rect(rect) for rect in rects]
+
+	count = None
+	while count != len(spans):
+		count = len(spans)
+		spans = merge_rects_pass(merge_rects_pass(spans, True), False)
+
+	return spans
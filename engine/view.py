@@ -1,5 +1,7 @@
+from pygame import sprite
 from pygame.math import Vector2
 from pygame.sprite import Rect
+from .constants import *
 
 class View:
 	def __init__(self, *size):
@@ -7,6 +9,9 @@ class View:
 		self.player = None
 		self.size = size
 		self.offset = Vector2(0, 0)
+		self.previous_offset = None
+		self.alpha = 1
+		self.view_rect = Rect(0, 0, 0, 0)
 
 	def get_size(self):
 		return self.size
@@ -25,9 +30,21 @@ class View:
 	def get_offset(self):
 		return self.offset
 
-	def in_view(self, rect):
-		vrect = Rect((self.offset.x, self.offset.y), (self.size[0], self.size[1]))
-		return rect.colliderect(vrect)
+	def set_alpha(self, alpha):
+		self.alpha = alpha
+
+	def get_render_offset(self):
+		if self.previous_offset is None or self.alpha >= 1:
+			return self.offset
+
+		return self.previous_offset.lerp(self.offset, self.alpha)
+
+	def get_view_rect(self, margin=0):
+		self.view_rect.update(self.offset.x - margin, self.offset.y - margin, self.size[0] + margin * 2, self.size[1] + margin * 2)
+		return self.view_rect
+
+	def in_view(self, rect, margin=0):
+		return rect.colliderect(self.get_view_rect(margin))
 		# return rect.left > self.offset.x and rect.bottom > self.offset.y and rect.top < self.offset.y + self.get_height()
 
 	def in_range(self, rect, distance):
@@ -46,5 +63,25 @@ class View:
 
 		return right_distance > distance or left_distance > distance
 
+	def step(self):
+		self.previous_offset = Vector2(self.offset)
+
 	def update(self):
 		pass
+
+class ViewGroup(sprite.Group):
+	def __init__(self, view, margin=VIEW_CULL_MARGIN):
+		super().__init__()
+		self.view = view
+		self.margin = margin
+
+	def visible(self):
+		in_view, margin = self.view.in_view, self.margin
+		return [s for s in self.sprites() if in_view(s.get_rect(), margin)]
+
+	def interpolate(self, alpha):
+		for s in self.visible():
+			s.interpolate(alpha)
+
+	def draw(self, surface):
+		surface.blits([(s.image, s.rect) for s in self.visible()], False)
@@ -2,20 +2,52 @@ from pygame import sprite
 from pygame.sprite import Rect
 from pygame.math import Vector2
 from .constants import *
+from .projectile import *
+from .broadphase import *
 
 class BusterPellet(sprite.Sprite):
-	def __init__(self, image, view, direction, *position):
+	# image and rect stay in the Sprite base's __dict__, the pellet state is slotted
+	__slots__ = ('pool', 'position', 'previous_position', 'bounding_rect', 'bounding_key', 'direction', 'speed', 'damage', 'view')
+
+	def __init__(self, pool=None):
 		super().__init__()
-		self.image = image
-		self.rect = image.get_rect()
-		self.position = Vector2(position[0], position[1])
-		self.direction = direction
+		self.pool = pool
+		self.image = None
+		self.rect = Rect(0, 0, 0, 0)
+		self.position = Vector2(0, 0)
+		self.previous_position = Vector2(0, 0)
+		self.bounding_rect = Rect(0, 0, 0, 0)
+		self.bounding_key = None
+		self.direction = 1
 		self.speed = 10
 		self.damage = 1
+		self.view = None
+
+	def fire(self, image, view, direction, *position):
+		self.image = image
+		self.rect.size = image.get_size()
+		self.position.update(position[0], position[1])
+		self.previous_position.update(position[0], position[1])
+		self.direction = direction
 		self.view = view
 
+		offset = view.get_offset()
+		self.rect.center = int(position[0] - offset.x), int(position[1] - offset.y)
+
+	def kill(self):
+		alive = self.alive()
+		super().kill()
+
+		if alive and self.pool is not None:
+			self.pool.release(self)
+
 	def get_rect(self):
-		return Rect((self.get_left(), self.get_top()), (self.get_width(), self.get_height()))
+		key = self.position.x, self.position.y, self.rect.width, self.rect.height
+		if key != self.bounding_key:
+			self.bounding_key = key
+			self.bounding_rect.update(self.get_left(), self.get_top(), self.rect.width, self.rect.height)
+
+		return self.bounding_rect
 
 	def get_width(self):
 		return self.rect.width
@@ -41,7 +73,11 @@ class BusterPellet(sprite.Sprite):
 	def get_damage(self):
 		return self.damage
 
+	def hold(self):
+		self.previous_position.update(self.position)
+
 	def update_position(self):
+		self.previous_position.update(self.position)
 		if self.direction == 1:
 			self.position.x += self.speed
 		else:
@@ -51,11 +87,17 @@ class BusterPellet(sprite.Sprite):
 		offset = self.view.get_offset()
 		self.rect.center = int(self.position.x - offset.x), int(self.position.y - offset.y)
 
+	def interpolate(self, alpha):
+		p = self.previous_position.lerp(self.position, alpha)
+		offset = self.view.get_render_offset()
+		self.rect.center = int(p.x - offset.x), int(p.y - offset.y)
+
 class Weapon:
 	def __init__(self, spritesheet_loader, sounds, player):
 		super().__init__()
 		self.spritesheet = spritesheet_loader.load(self.get_spritesheet_filename())
 		self.pew_sprite_group = sprite.Group()
+		self.pellet_pool = ProjectilePool(BusterPellet, BUSTER_PELLET_CAPACITY)
 		self.area = Rect(0, 0, int(SCREEN_W / 2), int(SCREEN_H / 2))
 		self.sounds = sounds
 		self.player = player
@@ -74,7 +116,11 @@ class Weapon:
 		view = player.get_view()
 		start_pos_x = player.get_right() if player.get_direction() else player.get_left()
 		start_pos_y = player.get_top() + int(player.get_height() / 3)
-		pellet = BusterPellet(self.pellet_image, view, player.get_direction(), start_pos_x, start_pos_y)
+		pellet = self.pellet_pool.acquire()
+		if pellet is None:
+			return None
+
+		pellet.fire(self.pellet_image, view, player.get_direction(), start_pos_x, start_pos_y)
 		self.pew_sprite_group.add(pellet)
 
 		self.sounds.play_sound('buster')
@@ -82,13 +128,15 @@ class Weapon:
 		return pellet
 
 	def check_hits(self, enemy_sprite_group):
-		if len(self.pew_sprite_group) > 0:
-			for pew in self.pew_sprite_group:
-				for enemy in enemy_sprite_group:
-					hit = enemy.collides_with(pew.get_rect())
-					if hit:
-						enemy.hit(pew, self.player)
-						pew.kill()
+		pews, enemies = self.pew_sprite_group.sprites(), enemy_sprite_group.sprites()
+		hits = overlapping_pairs([pew.get_rect() for pew in pews], [enemy.get_rect() for enemy in enemies])
+
+		for i, j in hits:
+			pew, enemy = pews[i], enemies[j]
+			# an enemy killed by an earlier pellet this tick can't be hit again
+			if enemy.alive():
+				enemy.hit(pew, self.player)
+				pew.kill()
 
 	def update(self, delta):
 		for pew in self.pew_sprite_group:
@@ -1,7 +1,9 @@
+from .constants import *
 from .object import *
 from .util import *
+from .grid import *
 
-class Zone(GameObject):
+class Zone(StaticObject):
 	def __init__(self, rect, name, **attributes):
 		if 'background' in attributes:
 			attributes['background'] = hex_to_rgb(attributes['background'])
@@ -10,3 +12,51 @@ class Zone(GameObject):
 
 	def get_background_color(self):
 		return self.attributes['background'] if 'background' in self.attributes else None
+
+class ZoneIndex:
+	def __init__(self, cell_size=BASE_SCREEN_SIZE):
+		self.grid = SpatialGrid(cell_size, cell_size)
+		self.zones = list()
+		self.neighbours = dict()
+		self.axes = dict()
+
+	def build(self, zones):
+		self.zones = list(zones)
+		for zone in self.zones:
+			self.grid.insert(zone)
+
+		for zone in self.zones:
+			edge = zone.rect.inflate(2, 2)
+			self.neighbours[zone.get_name()] = [other for other in self.grid.query(edge) if other is not zone and edge.colliderect(other.rect)]
+
+		for zone in self.zones:
+			for other in self.neighbours[zone.get_name()]:
+				self.axes[zone.get_name(), other.get_name()] = self.calculate_axis(zone, other)
+
+	def calculate_axis(self, from_zone, to_zone):
+		return 'y' if to_zone.get_position().y != from_zone.get_position().y else 'x'
+
+	def get_neighbours(self, zone):
+		return self.neighbours[zone.get_name()]
+
+	def get_axis(self, from_zone, to_zone):
+		key = from_zone.get_name(), to_zone.get_name()
+		return self.axes[key] if key in self.axes else self.calculate_axis(from_zone, to_zone)
+
+	def locate(self, rect, current=None):
+		count = 0
+		first, other = None, None
+		for zone in self.grid.query(rect):
+			if not rect.colliderect(zone.rect):
+				continue
+
+			count += 1
+			if first is None:
+				first = zone
+			if other is None and (current is None or zone.get_name() != current.get_name()):
+				other = zone
+
+		if count == 0:
+			return None
+
+		return first if count == 1 else other
@@ -1,4 +1,4 @@
-import os, sys, math, pygame, pytmx
+import os, sys, math, random, pygame, pytmx
 from pygame import Rect
 from pygame.time import Clock
 from functools import reduce
@@ -12,6 +12,24 @@ class GameConfig:
 	def get_map(self):
 		return MAP
 
+	def get_map_cache(self):
+		return MAP_CACHE
+
+	def get_present_mode(self):
+		return PRESENT_MODE
+
+	def get_fixed_timestep(self):
+		return FIXED_TIMESTEP
+
+	def get_headless(self):
+		return HEADLESS
+
+	def get_record_input(self):
+		return RECORD_INPUT
+
+	def get_replay_input(self):
+		return REPLAY_INPUT
+
 	def get_debug(self):
 		return dict(
 			map_debug = MAP_DEBUG,
@@ -19,6 +37,7 @@ class GameConfig:
 			start_zone = DEBUG_START_ZONE,
 			start_position = DEBUG_START_POSITION,
 			player_invincible = PLAYER_INVINCIBLE,
+			profiler = PROFILER,
 		)
 
 class GameLoop:
@@ -27,24 +46,14 @@ class GameLoop:
 		self.logger = logger
 		self.loader = loader
 		self.mode = None
+		self.mode_id = None
 		self.paused = False
+		self.running = True
 		self.clock = Clock()
 		self.debug = dict(map_debug=MAP_DEBUG, player_debug=PLAYER_DEBUG, start_zone=DEBUG_START_ZONE, start_position=DEBUG_START_POSITION)
-
-	def init_screen(self):
-		self.resolution = width, height = self.config.get_screen_resolution()
-		self.logger.debug('resolution: %dx%d' % (width, height))
-		self.screen = pygame.display.set_mode(self.resolution, pygame.HWSURFACE|pygame.DOUBLEBUF)
-		self.buffer = pygame.Surface((int(SCREEN_W), int(SCREEN_H)))
-
-	def init_audio(self):
-		self.mixer = pygame.mixer.init()
-		self.sounds = SoundLibrary(self.loader, self.mixer)
-		self.sounds.load()
-		self.music_player = MusicPlayer(self.loader)
-
-	def init_input(self):
-		self.input = KeyboardInput()
+		self.recorder = InputRecorder(game_config.get_record_input(), logger) if game_config.get_record_input() else None
+		self.input_player = InputPlayer(game_config.get_replay_input()) if game_config.get_replay_input() else None
+		self.services = Services(game_config, logger, loader)
 
 	def quit(self):
 		self.running = False
@@ -59,53 +68,159 @@ class GameLoop:
 		self.paused = False
 
 	def game_over(self):
-		self.set_mode(MODE_GAME_OVER)
+		if self.config.get_headless():
+			self.quit()
+		else:
+			self.set_mode(MODE_GAME_OVER)
+
+	def is_recording(self):
+		return self.mode_id == MODE_GAME and self.recorder is not None and self.recorder.is_recording()
+
+	def is_replaying(self):
+		return self.mode_id == MODE_GAME and self.input_player is not None
+
+	def start_recording(self):
+		if self.input_player is not None:
+			self.input_player.start()
+			return self.input_player.get_seed()
+
+		seed = random.randrange(2 ** 32)
+		if self.recorder is not None:
+			self.recorder.start(seed)
+
+		return seed
+
+	def stop_recording(self):
+		if self.recorder is not None:
+			self.recorder.stop()
+
+	def replay_events(self):
+		if self.is_replaying():
+			for event in self.input_player.next_events():
+				self.mode.handle_event(event)
+
+	def handle_events(self):
+		for event in pygame.event.get():
+			if event.type == pygame.QUIT:
+				self.stop_recording()
+				sys.exit()
+			elif self.is_replaying() and event.type in (pygame.KEYDOWN, pygame.KEYUP):
+				continue
+			else:
+				if self.is_recording():
+					self.recorder.record(event)
+				self.mode.handle_event(event)
+
+		self.replay_events()
+		self.services.get_sounds().update()
+
+	def update_mode(self, delta):
+		self.services.get_sounds().tick()
+		self.replay_events()
+		self.mode.update(delta)
+
+		if self.is_recording():
+			self.recorder.advance()
+
+		if self.is_replaying():
+			self.input_player.advance()
+			if self.input_player.is_finished() and self.config.get_headless():
+				self.quit()
+
+	def step(self, ticks=1):
+		for _ in range(ticks):
+			self.handle_events()
+
+			if not self.running:
+				break
+
+			if not self.paused:
+				self.update_mode(1 / FPS)
 
 	def loop(self):
 		self.running = True
+
+		if self.config.get_headless():
+			self.loop_headless()
+		elif self.config.get_fixed_timestep() or self.recorder is not None or self.input_player is not None:
+			self.loop_fixed()
+		else:
+			self.loop_variable()
+
+	def loop_fixed(self):
+		step = 1 / FPS
+		accumulator = 0
+		self.clock.tick()
+
+		while self.running:
+			self.handle_events()
+
+			if self.running:
+				frame_time = min(self.clock.tick(FPS) / 1000, step * MAX_TICKS_PER_FRAME)
+				if not self.paused:
+					accumulator += frame_time
+					while self.running and not self.paused and accumulator >= step:
+						self.update_mode(step)
+						accumulator -= step
+				self.mode.render(accumulator / step)
+
+	def loop_headless(self):
 		while self.running:
-			for event in pygame.event.get():
-				if event.type == pygame.QUIT:
-					sys.exit()
-				else:
-					self.mode.handle_event(event)
+			self.step()
+
+	def loop_variable(self):
+		while self.running:
+			self.handle_events()
 
 			if self.running:
+				delta = self.clock.tick(FPS) / 1000
 				if not self.paused:
-					delta = self.clock.tick(FPS) / 1000
-					self.mode.update(delta)
+					self.update_mode(delta)
 				self.mode.render()
 
 	def set_mode(self, mode_id):
-		self.init_screen()
-		self.init_audio()
-		self.init_input()
+		if self.mode_id == MODE_GAME:
+			self.stop_recording()
+
+		services = self.services
+		services.init()
 
 		pygame.event.clear()
 
+		input, screen, sounds, music_player = services.get_input(), services.get_screen(), services.get_sounds(), services.get_music_player()
+
 		if mode_id == MODE_MENU:
-			self.mode = Menu(self.logger, self.input, self.loader, self.screen, self.sounds, self.music_player, self)
+			self.mode = Menu(self.logger, input, self.loader, screen, sounds, music_player, self, services.get_presenter())
 		elif mode_id == MODE_GAME:
-			self.mode = Game(self.config, self.logger, self.input, self.loader, self.screen, self.sounds, self.music_player, self)
+			seed = self.start_recording()
+			self.mode = Game(self.config, self.logger, input, self.loader, screen, sounds, music_player, self, seed, services.get_spritesheet_loader(), services.get_presenter())
 		elif mode_id == MODE_GAME_OVER:
-			self.mode = GameOver(self.logger, self.input, self.loader, self.screen, self.sounds, self.music_player, self)
+			self.mode = GameOver(self.logger, input, self.loader, screen, sounds, music_player, self, services.get_presenter())
+
+		self.mode_id = mode_id
 
-	def start(self):
+	def start(self, mode_id=MODE_MENU):
 		if self.mode is None:
-			self.set_mode(MODE_MENU)
+			self.set_mode(mode_id)
 
 		self.loop()
+		self.stop_recording()
 
 def main():
 	if not pygame.font: print('Warning, fonts disabled')
 	if not pygame.mixer: print('Warning, sound disabled')
 
 	game_config = GameConfig()
+	if game_config.get_headless():
+		os.environ['SDL_VIDEODRIVER'] = 'dummy'
+		os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
 	logger = Logger(DEBUG)
 	loader = ResourceLoader(game_config, logger)
 	game = GameLoop(game_config, logger, loader)
 	pygame.init()
-	game.start()
+	game.start(MODE_GAME if game_config.get_headless() or game_config.get_replay_input() else MODE_MENU)
 	pygame.quit()
 
-main()
\ No newline at end of file
+if __name__ == '__main__':
+	main()
\ No newline at end of file